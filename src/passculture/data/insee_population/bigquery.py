@@ -6,10 +6,14 @@ import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 from loguru import logger
 
-from passculture.data.insee_population.constants import POPULATION_SCHEMAS
+from passculture.data.insee_population.constants import (
+    POPULATION_CLUSTERING,
+    POPULATION_SCHEMAS,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -34,7 +38,9 @@ def export_to_bigquery(
     The level is streamed to a temporary Parquet file via DuckDB's COPY and
     loaded with ``load_table_from_file`` — the full birth-month-expanded
     result (up to ~300M rows for IRIS) is never materialised in a pandas
-    DataFrame, keeping peak memory bounded.
+    DataFrame, keeping peak memory bounded. A table created by the load is
+    clustered on the level's ``POPULATION_CLUSTERING`` columns; an existing
+    table keeps its own clustering, since load jobs cannot change it.
 
     Args:
         processor: A PopulationProcessor with tables already created.
@@ -63,8 +69,11 @@ def export_to_bigquery(
         for col in POPULATION_SCHEMAS[level]
     ]
 
+    clustering = _clustering_for_new_table(client, table_ref, level)
+
     job_config = bigquery.LoadJobConfig(
         schema=schema,
+        clustering_fields=clustering,
         write_disposition=write_disposition,
         source_format=bigquery.SourceFormat.PARQUET,
     )
@@ -80,6 +89,31 @@ def export_to_bigquery(
     logger.info("Loaded {} rows ({}) to {}", job.output_rows, grain, table_ref)
 
 
+def _clustering_for_new_table(
+    client: bigquery.Client, table_ref: str, level: str
+) -> list[str] | None:
+    """Return the clustering fields to request, or None if the table exists.
+
+    A load job whose clustering differs from the existing table's fails, so
+    clustering is only requested when the load creates the table. Existing
+    tables without it have to be dropped once to pick it up.
+    """
+    clustering = list(POPULATION_CLUSTERING[level])
+    try:
+        existing = client.get_table(table_ref)
+    except NotFound:
+        return clustering
+    if list(existing.clustering_fields or ()) != clustering:
+        logger.warning(
+            "{} is clustered on {} instead of {}; drop the table to recreate "
+            "it with the expected clustering",
+            table_ref,
+            existing.clustering_fields,
+            clustering,
+        )
+    return None
+
+
 def export_all_to_bigquery(
     processor: PopulationProcessor,
     project_id: str,
@@ -26,6 +26,9 @@ class Method(str, Enum):
     cohort_aging = "cohort-aging"
 
 
+# Columns present at every level, usable as hive partition keys
+_PARTITION_COLUMNS = ("year", "month", "department_code", "region_code")
+
 app = typer.Typer(
     name="insee-population",
     help="INSEE population data import - creates multi-level geographic tables",
@@ -86,6 +89,24 @@ def population(
         "data/cache",
         help="Cache directory for downloads",
     ),
+    threads: int = typer.Option(
+        0,
+        "--threads",
+        help="DuckDB worker threads (default: all cores)",
+    ),
+    memory_limit: str = typer.Option(
+        "",
+        "--memory-limit",
+        help="DuckDB memory limit, e.g. 8GB (default: 80% of RAM)",
+    ),
+    spill: bool = typer.Option(
+        True,
+        "--spill/--no-spill",
+        help=(
+            "Let DuckDB spill to disk past the memory limit. --no-spill is "
+            "faster on large joins but fails if the run does not fit in RAM."
+        ),
+    ),
     monthly: bool = typer.Option(
         False,
         "--monthly/--no-monthly",
@@ -141,6 +162,14 @@ def population(
             "E.g. --monthly --yearly-levels epci,canton,iris"
         ),
     ),
+    partition_by: str = typer.Option(
+        "",
+        "--partition-by",
+        help=(
+            "Comma-separated columns to hive-partition local parquet output "
+            "by (one directory per level). E.g. --partition-by year"
+        ),
+    ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run",
@@ -202,6 +231,14 @@ def population(
             f"Valid: {valid_levels}.[/red bold]"
         )
         raise typer.Exit(code=1)
+    partition_columns = [c.strip() for c in partition_by.split(",") if c.strip()]
+    bad_columns = [c for c in partition_columns if c not in _PARTITION_COLUMNS]
+    if bad_columns:
+        console.print(
+            f"[red bold]Error: cannot partition by {bad_columns}. "
+            f"Valid: {list(_PARTITION_COLUMNS)}.[/red bold]"
+        )
+        raise typer.Exit(code=1)
     if yearly_level_list and not monthly:
         console.print(
             "[yellow]Note: --yearly-levels has no effect without --monthly "
@@ -239,39 +276,50 @@ def population(
             monthly=monthly,
             method=method.value,
             cache_dir=cache_dir,
+            threads=threads or None,
+            memory_limit=memory_limit or None,
+            spill=spill,
         )
     except ValueError as e:
         console.print(f"[red bold]Error: {e}[/red bold]")
         raise typer.Exit(code=1) from None
 
-    processor.download_and_process()
-    processor.create_multi_level_tables()
-
-    _print_summary(processor)
-
-    if dry_run:
-        _print_preview(processor)
-    elif to_bigquery:
-        from passculture.data.insee_population.bigquery import export_all_to_bigquery
-
-        console.print(f"\n[bold]Exporting to BigQuery: {project_id}.{dataset}[/bold]")
-        export_all_to_bigquery(
-            processor,
-            project_id,
-            dataset,
-            table_prefix,
-            levels=selected_levels,
-            yearly_levels=yearly_level_list,
-        )
-        console.print("[green]BigQuery export complete.[/green]")
-    else:
-        output_path = Path(output_dir)
-        paths = processor.save_multi_level(output_path)
-
-        console.print(f"\n[green]Saved to {output_path}/[/green]")
-        for _level, path in paths.items():
-            size_mb = path.stat().st_size / 1024 / 1024
-            console.print(f"  {path.name} ({size_mb:.1f} MB)")
+    with processor:
+        processor.download_and_process()
+        processor.create_multi_level_tables()
+
+        _print_summary(processor)
+
+        if dry_run:
+            _print_preview(processor)
+        elif to_bigquery:
+            from passculture.data.insee_population.bigquery import (
+                export_all_to_bigquery,
+            )
+
+            console.print(
+                f"\n[bold]Exporting to BigQuery: {project_id}.{dataset}[/bold]"
+            )
+            export_all_to_bigquery(
+                processor,
+                project_id,
+                dataset,
+                table_prefix,
+                levels=selected_levels,
+                yearly_levels=yearly_level_list,
+            )
+            console.print("[green]BigQuery export complete.[/green]")
+        else:
+            output_path = Path(output_dir)
+            paths = processor.save_multi_level(
+                output_path, partition_by=partition_columns
+            )
+
+            console.print(f"\n[green]Saved to {output_path}/[/green]")
+            for _level, path in paths.items():
+                files = path.rglob("*.parquet") if path.is_dir() else [path]
+                size_mb = sum(f.stat().st_size for f in files) / 1024 / 1024
+                console.print(f"  {path.name} ({size_mb:.1f} MB)")
 
 
 def _print_preview(processor) -> None:
@@ -295,11 +343,17 @@ def _print_summary(processor) -> None:
     """Print summary statistics for the processed data."""
     console.print("\n[bold]Summary by geographic level:[/bold]")
 
+    existing = {
+        name
+        for (name,) in processor.conn.execute(
+            "SELECT table_name FROM duckdb_tables()"
+        ).fetchall()
+    }
     for level in ["department", "epci", "canton", "iris"]:
         table = f"population_{level}"
-        try:
+        if table in existing:
             _print_level_summary(processor, level, table)
-        except Exception:
+        else:
             console.print(f"  {level}: [dim]not available[/dim]")
 
 
@@ -320,13 +374,11 @@ def _print_level_summary(processor, level: str, table: str) -> None:
         geo_col = "department_code"
         geo_label = "depts"
 
-    stats = conn.execute(
-        f"SELECT COUNT(*), SUM(population), COUNT(DISTINCT {geo_col}) FROM {table}"
+    # One scan for every figure: these tables can hold hundreds of millions of rows
+    count, total_pop, n_geo, n_years, n_ages = conn.execute(
+        f"SELECT COUNT(*), SUM(population), COUNT(DISTINCT {geo_col}),"
+        f" COUNT(DISTINCT year), COUNT(DISTINCT age) FROM {table}"
     ).fetchone()
-    count, total_pop, n_geo = stats
-
-    n_years = conn.execute(f"SELECT COUNT(DISTINCT year) FROM {table}").fetchone()[0]
-    n_ages = conn.execute(f"SELECT COUNT(DISTINCT age) FROM {table}").fetchone()[0]
     avg_pop = total_pop / (n_years * 12) if n_years else 0
     avg_cohort = avg_pop / n_ages if n_ages else 0
     console.print(
@@ -1,5 +1,7 @@
 """Constants for INSEE data imports."""
 
+from types import MappingProxyType
+
 # INSEE INDCVI file URLs
 # Main file: France hors Mayotte (metro + DOM)
 # COM file: Saint-Barthélemy, Saint-Martin, Saint-Pierre-et-Miquelon
@@ -130,25 +132,37 @@ STUDENT_MOBILITY_BLEND_DEFAULT_BY_BAND: dict[str, float] = {
     "20_24": 0.30,
 }
 
-# Department codes
-DEPARTMENTS_METRO = [f"{i:02d}" for i in range(1, 96) if i != 20] + ["2A", "2B"]
+# Department codes (immutable, ordered; see the *_SET variants for membership)
+DEPARTMENTS_METRO = (*(f"{i:02d}" for i in range(1, 96) if i != 20), "2A", "2B")
 # DOM departments available in INDCVI census data
-DEPARTMENTS_DOM = [
+DEPARTMENTS_DOM = (
     "971",
     "972",
     "973",
     "974",
-]  # Guadeloupe, Martinique, Guyane, Réunion
+)  # Guadeloupe, Martinique, Guyane, Réunion
 # 976 (Mayotte) has separate census - not in standard INDCVI files
-DEPARTMENTS_MAYOTTE = ["976"]
-DEPARTMENTS_COM = ["975", "977", "978"]  # Saint-Pierre, Saint-Barth, Saint-Martin
+DEPARTMENTS_MAYOTTE = ("976",)
+DEPARTMENTS_COM = ("975", "977", "978")  # Saint-Pierre, Saint-Barth, Saint-Martin
 # TOM Pacifique eligible for pass Culture residency: Wallis-et-Futuna (986) and
 # Nouvelle-Calédonie (988). Polynésie française (987) is NOT in the pass Culture
 # residency list, so it is excluded from the default territory set (its parser
 # in downloaders.py is kept for reference but not synthesized by default).
 # Saint-Pierre-et-Miquelon (975) is also eligible but has no machine-readable
 # census source wired yet (~60 people per single-year cohort — a known gap).
-DEPARTMENTS_TOM = ["986", "988"]  # Wallis-Futuna, Nouvelle-Calédonie
+DEPARTMENTS_TOM = ("986", "988")  # Wallis-Futuna, Nouvelle-Calédonie
+
+# Hashed views for membership tests / pandas ``isin`` filters
+DEPARTMENTS_METRO_SET = frozenset(DEPARTMENTS_METRO)
+DEPARTMENTS_DOM_SET = frozenset(DEPARTMENTS_DOM)
+DEPARTMENTS_TOM_SET = frozenset(DEPARTMENTS_TOM)
+DEPARTMENTS_ALL = frozenset(
+    DEPARTMENTS_METRO
+    + DEPARTMENTS_DOM
+    + DEPARTMENTS_MAYOTTE
+    + DEPARTMENTS_COM
+    + DEPARTMENTS_TOM
+)
 
 # Wallis-et-Futuna 2023 census (STSEE) — population by sex and 5-year age band
 WLF_CENSUS_YEAR = 2023
@@ -278,6 +292,20 @@ CI_EXTRA_IRIS = 0.10  # additional uncertainty for IRIS geo_ratio
 # Order must match STUDENT_BAND_AGEREV10 keys.
 STUDENT_AGE_BANDS = ("15_19", "20_24")
 
+# Parquet options for the parsed-source caches under --cache-dir. They are
+# written once and re-read every run; zstd level 3 is smaller than the snappy
+# default at similar decode speed. The engine is pinned so pandas never picks
+# fastparquet, which would ignore compression_level.
+CACHE_PARQUET_ENGINE = "pyarrow"
+CACHE_PARQUET_WRITE_OPTIONS = MappingProxyType(
+    {
+        "engine": CACHE_PARQUET_ENGINE,
+        "compression": "zstd",
+        "compression_level": 3,
+        "index": False,
+    }
+)
+
 # IRIS sentinel values in INDCVI census data
 IRIS_SENTINEL_NO_GEO = "ZZZZZZZZZ"  # commune has no IRIS coverage
 IRIS_SENTINEL_MASKED_SUFFIX = "XXXX"  # IRIS masked (< 200 inhabitants)
@@ -287,87 +315,133 @@ MAX_AGE = 120
 
 
 # BigQuery schema for population tables (per geographic level)
+# Fields are read-only and shared between the per-level tuples, so a caller
+# cannot mutate one level's schema through another.
 # Common columns shared by all levels
-_COMMON_SCHEMA = [
-    {"name": "year", "type": "INTEGER", "description": "Projection year"},
-    {
-        "name": "month",
-        "type": "INTEGER",
-        "description": "Snapshot month (1-12, or 1 in yearly mode)",
-    },
-    {
-        "name": "birth_month",
-        "type": "INTEGER",
-        "description": "Estimated birth month (1-12)",
-    },
-    {
-        "name": "snapshot_month",
-        "type": "DATE",
-        "description": "First day of observation month",
-    },
-    {
-        "name": "born_date",
-        "type": "DATE",
-        "description": "First day of estimated birth month/year",
-    },
-    {
-        "name": "decimal_age",
-        "type": "FLOAT",
-        "description": "Age in years derived from snapshot_month and born_date",
-    },
-    {
-        "name": "department_code",
-        "type": "STRING",
-        "description": "Department code (2-3 chars)",
-    },
-    {"name": "region_code", "type": "STRING", "description": "Region code"},
-    {"name": "age", "type": "INTEGER", "description": "Age in completed years (0-120)"},
-    {"name": "sex", "type": "STRING", "description": "Sex (male/female)"},
-    {
-        "name": "geo_precision",
-        "type": "STRING",
-        "description": "Geographic precision indicator",
-    },
-    {"name": "population", "type": "FLOAT", "description": "Population estimate"},
-    {
-        "name": "confidence_pct",
-        "type": "FLOAT",
-        "description": "Estimated error margin (0-1)",
-    },
-    {
-        "name": "population_low",
-        "type": "FLOAT",
-        "description": "Population lower bound (population * (1 - confidence_pct))",
-    },
-    {
-        "name": "population_high",
-        "type": "FLOAT",
-        "description": "Population upper bound (population * (1 + confidence_pct))",
-    },
-]
+_COMMON_SCHEMA = (
+    MappingProxyType(
+        {"name": "year", "type": "INTEGER", "description": "Projection year"}
+    ),
+    MappingProxyType(
+        {
+            "name": "month",
+            "type": "INTEGER",
+            "description": "Snapshot month (1-12, or 1 in yearly mode)",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "birth_month",
+            "type": "INTEGER",
+            "description": "Estimated birth month (1-12)",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "snapshot_month",
+            "type": "DATE",
+            "description": "First day of observation month",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "born_date",
+            "type": "DATE",
+            "description": "First day of estimated birth month/year",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "decimal_age",
+            "type": "FLOAT",
+            "description": "Age in years derived from snapshot_month and born_date",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "department_code",
+            "type": "STRING",
+            "description": "Department code (2-3 chars)",
+        }
+    ),
+    MappingProxyType(
+        {"name": "region_code", "type": "STRING", "description": "Region code"}
+    ),
+    MappingProxyType(
+        {
+            "name": "age",
+            "type": "INTEGER",
+            "description": "Age in completed years (0-120)",
+        }
+    ),
+    MappingProxyType(
+        {"name": "sex", "type": "STRING", "description": "Sex (male/female)"}
+    ),
+    MappingProxyType(
+        {
+            "name": "geo_precision",
+            "type": "STRING",
+            "description": "Geographic precision indicator",
+        }
+    ),
+    MappingProxyType(
+        {"name": "population", "type": "FLOAT", "description": "Population estimate"}
+    ),
+    MappingProxyType(
+        {
+            "name": "confidence_pct",
+            "type": "FLOAT",
+            "description": "Estimated error margin (0-1)",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "population_low",
+            "type": "FLOAT",
+            "description": "Population lower bound (population * (1 - confidence_pct))",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "population_high",
+            "type": "FLOAT",
+            "description": "Population upper bound (population * (1 + confidence_pct))",
+        }
+    ),
+)
 
 # Per-level schemas matching SQL output column order
-POPULATION_SCHEMA_DEPARTMENT = list(_COMMON_SCHEMA)
+POPULATION_SCHEMA_DEPARTMENT = _COMMON_SCHEMA
 
-POPULATION_SCHEMA_EPCI = [
+POPULATION_SCHEMA_EPCI = (
     *_COMMON_SCHEMA[:8],  # up to region_code
-    {"name": "epci_code", "type": "STRING", "description": "EPCI SIREN code"},
+    MappingProxyType(
+        {"name": "epci_code", "type": "STRING", "description": "EPCI SIREN code"}
+    ),
     *_COMMON_SCHEMA[8:],  # age onward
-]
+)
 
-POPULATION_SCHEMA_CANTON = [
+POPULATION_SCHEMA_CANTON = (
     *_COMMON_SCHEMA[:8],  # up to region_code
-    {"name": "canton_code", "type": "STRING", "description": "Canton code"},
+    MappingProxyType(
+        {"name": "canton_code", "type": "STRING", "description": "Canton code"}
+    ),
     *_COMMON_SCHEMA[8:],  # age onward
-]
+)
 
-POPULATION_SCHEMA_IRIS = [
+POPULATION_SCHEMA_IRIS = (
     *_COMMON_SCHEMA[:8],  # up to region_code
-    {"name": "epci_code", "type": "STRING", "description": "EPCI SIREN code"},
-    {"name": "commune_code", "type": "STRING", "description": "Commune INSEE code"},
-    {"name": "iris_code", "type": "STRING", "description": "IRIS code (9 chars)"},
+    MappingProxyType(
+        {"name": "epci_code", "type": "STRING", "description": "EPCI SIREN code"}
+    ),
+    MappingProxyType(
+        {"name": "commune_code", "type": "STRING", "description": "Commune INSEE code"}
+    ),
+    MappingProxyType(
+        {"name": "iris_code", "type": "STRING", "description": "IRIS code (9 chars)"}
+    ),
     *_COMMON_SCHEMA[8:],  # age onward
-]
+)
 
 # Lookup dict for bigquery.py
 POPULATION_SCHEMAS = {
@@ -376,3 +450,12 @@ POPULATION_SCHEMAS = {
     "canton": POPULATION_SCHEMA_CANTON,
     "iris": POPULATION_SCHEMA_IRIS,
 }
+
+# BigQuery clustering columns per level (at most 4, coarsest first) so that
+# the usual ``WHERE department_code = ... AND year = ...`` filters prune blocks
+POPULATION_CLUSTERING = {
+    "department": ("department_code", "year"),
+    "epci": ("department_code", "epci_code", "year"),
+    "canton": ("department_code", "canton_code", "year"),
+    "iris": ("department_code", "commune_code", "iris_code", "year"),
+}
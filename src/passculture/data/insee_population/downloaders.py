@@ -9,10 +9,18 @@ Handles HTTP downloads and Excel parsing for:
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
 import io
+import shutil
 import tempfile
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import IO, TypeVar
 
 import pandas as pd
 import requests
@@ -20,12 +28,12 @@ from loguru import logger
 from rich.progress import Progress
 
 from passculture.data.insee_population.constants import (
+    CACHE_PARQUET_ENGINE,
+    CACHE_PARQUET_WRITE_OPTIONS,
     DEPARTMENT_TO_REGION,
-    DEPARTMENTS_COM,
-    DEPARTMENTS_DOM,
-    DEPARTMENTS_MAYOTTE,
-    DEPARTMENTS_METRO,
-    DEPARTMENTS_TOM,
+    DEPARTMENTS_ALL,
+    DEPARTMENTS_METRO_SET,
+    DEPARTMENTS_TOM_SET,
     INDCVI_URLS,
     INDREG_URLS,
     INSEE_ESTIMATES_URL,
@@ -50,51 +58,111 @@ from passculture.data.insee_population.constants import (
 # Department codes that may appear in INDCVI / monthly_births output. Anything
 # outside this set in INDREG (e.g. '99' = foreign / unknown) is dropped before
 # building the distribution.
-_VALID_DEPARTMENTS = (
-    set(DEPARTMENTS_METRO)
-    | set(DEPARTMENTS_DOM)
-    | set(DEPARTMENTS_COM)
-    | set(DEPARTMENTS_MAYOTTE)
-    | set(DEPARTMENTS_TOM)
-)
+_VALID_DEPARTMENTS = DEPARTMENTS_ALL
 
 # HTTP timeouts
 DOWNLOAD_TIMEOUT = 600  # 10 minutes for large census files
 ESTIMATES_TIMEOUT = 120  # 2 minutes for smaller files
-CHUNK_SIZE = 131072  # 128KB chunks
+CHUNK_SIZE = 1024 * 1024  # 1 MiB read size for streamed downloads
 DOWNLOAD_RETRIES = 3  # retries for truncated/dropped large downloads
+SPOOL_MAX_SIZE = 8 * 1024 * 1024  # in-memory limit before spooling to disk
+MAX_PARALLEL_DOWNLOADS = 4  # concurrent source fetches (see fetch_concurrently)
+
+T = TypeVar("T")
+
+# One pooled session for every INSEE fetch: most sources live on www.insee.fr,
+# so keep-alive saves a TCP+TLS handshake per file.
+_HTTP = requests.Session()
+
+# Scratch directory for downloads made without a cache_dir (see _session_dir).
+_session_lock = threading.Lock()
+_session_tmp: Path | None = None
 
 # Parquet files start and end with this 4-byte magic; used to detect the
 # silently truncated downloads INSEE's chunked/gzip transfer can produce.
 _PARQUET_MAGIC = b"PAR1"
 
 
+def _session_dir() -> Path:
+    """Return this process's scratch download directory, removed at exit."""
+    global _session_tmp
+    with _session_lock:
+        if _session_tmp is None:
+            _session_tmp = Path(tempfile.mkdtemp(prefix="insee_population_"))
+            atexit.register(shutil.rmtree, _session_tmp, ignore_errors=True)
+        return _session_tmp
+
+
 def _cached_parquet(url: str, filename: str, cache_dir: Path | None) -> Path:
     """Return a local path to the parquet at ``url``, caching by filename.
 
     A cached file that fails parquet validation (e.g. a truncated download
     from a previous interrupted run) is discarded and re-fetched rather than
-    reused.
+    reused. Without a ``cache_dir`` the file goes to a per-process temporary
+    directory, so repeated calls in one run still download it only once.
     """
-    if cache_dir:
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        parquet_path = cache_dir / filename
-        if parquet_path.exists():
-            if _is_valid_parquet(parquet_path):
-                logger.debug("Using cached: {}", parquet_path)
-                return parquet_path
-            logger.warning(
-                "Cached {} is corrupt (bad parquet magic); re-downloading",
-                parquet_path,
-            )
-            parquet_path.unlink()
-    else:
-        parquet_path = Path(tempfile.mkdtemp()) / filename
+    cache_dir = cache_dir or _session_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    parquet_path = cache_dir / filename
+    if parquet_path.exists():
+        if _is_valid_parquet(parquet_path):
+            logger.debug("Using cached: {}", parquet_path)
+            return parquet_path
+        logger.warning(
+            "Cached {} is corrupt (bad parquet magic); re-downloading",
+            parquet_path,
+        )
+        parquet_path.unlink()
 
-    _download_file(url, parquet_path, validate=_is_valid_parquet)
+    download_file(url, parquet_path, validate=_is_valid_parquet)
     return parquet_path
 
 
+@functools.lru_cache(maxsize=16)
+def _load_cached_frame(path: str, mtime_ns: int) -> pd.DataFrame:
+    return pd.read_parquet(path, engine=CACHE_PARQUET_ENGINE)
+
+
+def read_cached_frame(cache_path: Path) -> pd.DataFrame:
+    """Read a derived-source cache parquet, memoised per file version.
+
+    Repeated processors in one process (e.g. several year ranges) reuse the
+    parsed frame; keying on mtime picks up a rewritten cache. Callers get a
+    copy, so mutating the result never leaks into the memo.
+    """
+    return _load_cached_frame(str(cache_path), cache_path.stat().st_mtime_ns).copy()
+
+
+def _url_cache_name(stem: str, url: str) -> str:
+    """Return a cache filename that changes whenever the source URL does.
+
+    For sources whose URL is bumped in place each release (e.g. POP3), so a
+    new release is fetched instead of a stale cache being reused.
+    """
+    digest = hashlib.sha256(url.encode()).hexdigest()[:12]
+    return f"{stem}_{digest}.parquet"
+
+
+def fetch_concurrently(
+    jobs: Mapping[str, Callable[[], T]],
+    max_workers: int = MAX_PARALLEL_DOWNLOADS,
+) -> dict[str, T]:
+    """Run independent download jobs on a thread pool and collect the results.
+
+    INSEE throttles each connection, so fetching several sources side by side
+    brings cold-cache setup down to roughly the slowest single file. Jobs are
+    plain callables (typically ``functools.partial`` over a ``download_*``
+    function); each keeps its own caching and retry behaviour. If a job fails,
+    its exception is re-raised once every job has finished.
+
+    Returns:
+        Mapping of job name to its result, in ``jobs`` order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {name: pool.submit(job) for name, job in jobs.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
 def download_indcvi(year: int, cache_dir: Path | None) -> Path:
     """Download INDCVI census parquet file."""
     if year not in INDCVI_URLS:
@@ -142,19 +210,22 @@ def download_insee_estimates(cache_dir: Path | None = None) -> pd.DataFrame:
     cohort totals to INSEE's latest estimate. Returns an empty DataFrame when
     the file cannot be fetched/parsed so callers can fall back to RP2022-frozen.
     """
-    cache_path = cache_dir / "insee_estimates_pop3.parquet" if cache_dir else None
+    cache_path = (
+        cache_dir / _url_cache_name("insee_estimates_pop3", INSEE_ESTIMATES_URL)
+        if cache_dir
+        else None
+    )
     if cache_path and cache_path.exists():
         logger.debug("Using cached INSEE estimates: {}", cache_path)
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         logger.info(
             "Downloading INSEE population estimates (POP3) from {}...",
             INSEE_ESTIMATES_URL,
         )
-        response = requests.get(INSEE_ESTIMATES_URL, timeout=ESTIMATES_TIMEOUT)
-        response.raise_for_status()
-        df = _parse_pop3(response.content)
+        with _fetch_to_spool(INSEE_ESTIMATES_URL) as workbook:
+            df = _parse_pop3(workbook)
     except Exception as e:
         logger.warning("Could not fetch/parse INSEE estimates: {}", e)
         return pd.DataFrame()
@@ -164,12 +235,12 @@ def download_insee_estimates(cache_dir: Path | None = None) -> pd.DataFrame:
 
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
 
     return df
 
 
-def _parse_pop3(xlsx_bytes: bytes) -> pd.DataFrame:
+def _parse_pop3(xlsx_bytes: bytes | IO[bytes]) -> pd.DataFrame:
     """Parse the POP3 workbook (one sheet per year) into a long table.
 
     Sheet layout (header on row 4, data from row 6):
@@ -181,38 +252,35 @@ def _parse_pop3(xlsx_bytes: bytes) -> pd.DataFrame:
     """
     import openpyxl
 
-    wb = openpyxl.load_workbook(io.BytesIO(xlsx_bytes), read_only=True, data_only=True)
-    rows: list[dict] = []
+    wb = openpyxl.load_workbook(_as_stream(xlsx_bytes), read_only=True, data_only=True)
+    frames: list[pd.DataFrame] = []
     for sheet in wb.sheetnames:
         if not (len(sheet) == 4 and sheet.isdigit()):
             continue
-        year = int(sheet)
-        for row in wb[sheet].iter_rows(min_row=5, values_only=True):
-            naissance = row[0]
-            if not isinstance(naissance, int):
-                continue
-            male, female = row[6], row[7]
-            nums = (int, float)
-            if not isinstance(male, nums) or not isinstance(female, nums):
-                continue
-            rows.append(
-                {
-                    "year": year,
-                    "naissance": naissance,
-                    "sex": "male",
-                    "population": float(male),
-                }
-            )
-            rows.append(
+        cells = (
+            pd.DataFrame(wb[sheet].iter_rows(min_row=5, max_col=8, values_only=True))
+            .reindex(columns=[0, 6, 7])
+            .apply(pd.to_numeric, errors="coerce")
+        )
+        # Labels, notes and blank rows coerce to NaN whatever dtype pandas
+        # inferred; a génération row also needs a whole birth year.
+        keep = cells.notna().all(axis=1) & (cells[0] % 1 == 0)
+        data = cells[keep]
+        frames.extend(
+            pd.DataFrame(
                 {
-                    "year": year,
-                    "naissance": naissance,
-                    "sex": "female",
-                    "population": float(female),
+                    "year": int(sheet),
+                    "naissance": data[0].astype("int64"),
+                    "sex": sex,
+                    "population": data[col].astype("float64"),
                 }
             )
+            for sex, col in (("male", 6), ("female", 7))
+        )
     wb.close()
-    return pd.DataFrame(rows)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
 
 
 # -----------------------------------------------------------------------------
@@ -246,7 +314,7 @@ def download_mnai_birth_distribution(
     )
     if cache_path and cache_path.exists():
         logger.debug("Using cached MNAI birth distribution: {}", cache_path)
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         parquet_path = download_indreg(year, cache_dir)
@@ -267,7 +335,7 @@ def download_mnai_birth_distribution(
 
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        result.to_parquet(cache_path, index=False)
+        result.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
 
     return result
 
@@ -307,40 +375,23 @@ def _build_mnai_distribution(df: pd.DataFrame) -> pd.DataFrame:
     )
     region_rows = _month_ratios(df, ["REGION", "month"], "REGION")
     metro_rows = _month_ratios(
-        df[df["DEPT"].isin(set(DEPARTMENTS_METRO))], ["month"], None
+        df[df["DEPT"].isin(DEPARTMENTS_METRO_SET)], ["month"], None
     )
 
-    region_distributions: dict[str, list[tuple[int, float]]] = {
-        region: [(int(r["month"]), float(r["month_ratio"])) for _, r in grp.iterrows()]
-        for region, grp in region_rows.groupby("REGION")
-    }
-    metro_dist: list[tuple[int, float]] = [
-        (int(r["month"]), float(r["month_ratio"])) for _, r in metro_rows.iterrows()
-    ]
-
-    rows: list[dict] = []
-    for dept in sorted(_VALID_DEPARTMENTS):
-        if dept in big_depts:
-            for _, r in dept_rows[dept_rows["DEPT"] == dept].iterrows():
-                rows.append(
-                    {
-                        "department_code": dept,
-                        "month": int(r["month"]),
-                        "month_ratio": float(r["month_ratio"]),
-                    }
-                )
-            continue
+    dept_part = dept_rows.rename(columns={"DEPT": "department_code"})
 
-        region = DEPARTMENT_TO_REGION.get(dept)
-        dist = region_distributions.get(region) if region else None
-        if not dist:
-            # Region absent from INDREG (Mayotte, DOM, COM): use metro.
-            dist = metro_dist
-        for month, ratio in dist:
-            rows.append({"department_code": dept, "month": month, "month_ratio": ratio})
+    small = pd.DataFrame(
+        {"department_code": sorted(_VALID_DEPARTMENTS - big_depts)}
+    ).assign(REGION=lambda d: d["department_code"].map(DEPARTMENT_TO_REGION))
+    has_region = small["REGION"].isin(region_rows["REGION"])
+    region_part = small[has_region].merge(region_rows, on="REGION")
+    # Region absent from INDREG (Mayotte, DOM, COM): use metro.
+    metro_part = small[~has_region].merge(metro_rows, how="cross")
 
+    result = pd.concat([dept_part, region_part, metro_part], ignore_index=True)
     return (
-        pd.DataFrame(rows)
+        result[["department_code", "month", "month_ratio"]]
+        .astype({"month": "int64", "month_ratio": "float64"})
         .sort_values(["department_code", "month"])
         .reset_index(drop=True)
     )
@@ -388,13 +439,12 @@ def download_mayotte_pop1b(
     cache_path = cache_dir / "mayotte_pop1b_2017.parquet" if cache_dir else None
     if cache_path and cache_path.exists():
         logger.debug("Using cached Mayotte POP1B: {}", cache_path)
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         logger.info("Downloading Mayotte 2017 POP1B from {}", MAYOTTE_POP1B_URL)
-        response = requests.get(MAYOTTE_POP1B_URL, timeout=ESTIMATES_TIMEOUT)
-        response.raise_for_status()
-        xls_bytes = _extract_zip_member(response.content, MAYOTTE_POP1B_MEMBER)
+        with _fetch_to_spool(MAYOTTE_POP1B_URL) as archive:
+            xls_bytes = _extract_zip_member(archive, MAYOTTE_POP1B_MEMBER)
         df = _parse_pop1b_wide(xls_bytes)
     except Exception as e:
         logger.warning("Could not fetch Mayotte POP1B: {}", e)
@@ -405,16 +455,39 @@ def download_mayotte_pop1b(
 
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
 
     return df
 
 
-def _extract_zip_member(zip_bytes: bytes, member_name: str) -> bytes:
+@contextmanager
+def _fetch_to_spool(url: str, timeout: int = ESTIMATES_TIMEOUT) -> Iterator[IO[bytes]]:
+    """Stream ``url`` into a spooled temporary file, rewound for reading.
+
+    Responses up to ``SPOOL_MAX_SIZE`` stay in memory; larger ones roll over
+    to disk, so peak memory no longer scales with the download size.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        # Closing the response hands its connection back to the pool even
+        # when the status check or the body stream fails.
+        with _HTTP.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                spool.write(chunk)
+        spool.seek(0)
+        yield spool
+
+
+def _as_stream(data: bytes | IO[bytes]) -> IO[bytes]:
+    """Wrap raw bytes for readers that want a file; pass open files through."""
+    return io.BytesIO(data) if isinstance(data, bytes) else data
+
+
+def _extract_zip_member(archive: IO[bytes], member_name: str) -> bytes:
     """Return the raw bytes for a single file inside a zip archive."""
     import zipfile
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+    with zipfile.ZipFile(archive) as zf:
         # Tolerate extra directory prefixes INSEE may add in the future.
         candidates = [n for n in zf.namelist() if n.endswith(member_name)]
         if not candidates:
@@ -497,26 +570,21 @@ def _extract_pop1b_wide_rows(
         return pd.DataFrame()
 
     # Sum population across commune rows (optionally filtered by CODGEO prefix).
-    totals: dict[tuple[str, int], float] = {}
-    for i in range(codgeo_row + 1, len(raw)):
-        codgeo = raw.iloc[i, 0]
-        if pd.isna(codgeo):
-            continue
-        if codgeo_prefix is not None and not str(codgeo).strip().startswith(
-            codgeo_prefix
-        ):
-            continue
-        for sex, age, col in col_map:
-            value = _safe_float(raw.iloc[i, col])
-            key = (sex, age)
-            totals[key] = totals.get(key, 0.0) + value
-
-    rows = [
-        {"age": age, "sex": sex, "population": pop}
-        for (sex, age), pop in totals.items()
-        if pop > 0
-    ]
-    return pd.DataFrame(rows).sort_values(["age", "sex"]).reset_index(drop=True)
+    body = raw.iloc[codgeo_row + 1 :]
+    codgeo = body.iloc[:, 0]
+    keep = codgeo.notna()
+    if codgeo_prefix is not None:
+        keep &= codgeo.astype(str).str.strip().str.startswith(codgeo_prefix)
+    sexes, ages, cols = zip(*col_map, strict=True)
+    values = body.loc[keep].iloc[:, list(cols)]
+    col_sums = [values.iloc[:, j].map(_safe_float).sum() for j in range(len(cols))]
+
+    totals = (
+        pd.DataFrame({"age": ages, "sex": sexes, "population": col_sums})
+        .groupby(["age", "sex"], as_index=False)["population"]
+        .sum()
+    )
+    return totals[totals["population"] > 0].reset_index(drop=True)
 
 
 def _normalize_sex_code(raw: object) -> str:
@@ -548,13 +616,18 @@ def _parse_age_label(raw: object) -> int | None:
         return None
 
 
+# French-formatted numbers: drop space / NBSP / narrow-NBSP thousands
+# separators and turn the decimal comma into a point, in a single pass.
+_FR_NUMBER_TABLE = str.maketrans({" ": None, "\u00a0": None, "\u202f": None, ",": "."})
+
+
 def _safe_float(value: object) -> float:
     """Parse a POP1B cell: accepts numerics, French-formatted strings, or NaN."""
     if pd.isna(value):
         return 0.0
     if isinstance(value, (int, float)):
         return float(value)
-    text = str(value).replace(" ", "").replace(",", ".")
+    text = str(value).translate(_FR_NUMBER_TABLE)
     try:
         return float(text)
     except ValueError:
@@ -587,7 +660,7 @@ def _is_valid_parquet(path: Path) -> bool:
         return False
 
 
-def _download_file(
+def download_file(
     url: str,
     dest: Path,
     validate: Callable[[Path], bool] | None = None,
@@ -630,24 +703,58 @@ def _download_file(
     raise OSError(f"Failed to download {url} after {retries} attempts") from last_error
 
 
+# rich allows one live display at a time: concurrent downloads each add a task
+# to a single shared Progress, started by its first user and stopped by its last.
+_progress_lock = threading.Lock()
+_progress: Progress | None = None
+_progress_users = 0
+
+
+@contextmanager
+def _shared_progress() -> Iterator[Progress]:
+    """Yield the download progress display shared by all running downloads."""
+    global _progress, _progress_users
+    with _progress_lock:
+        if _progress is None:
+            _progress = Progress(transient=True)
+            _progress.start()
+        _progress_users += 1
+        progress = _progress
+    try:
+        yield progress
+    finally:
+        with _progress_lock:
+            _progress_users -= 1
+            if _progress_users == 0:
+                progress.stop()
+                _progress = None
+
+
 def _stream_to_file(url: str, tmp: Path) -> int:
     """Stream ``url`` into ``tmp``, returning the number of bytes written.
 
     Enforces ``Content-Length`` when the server advertises it (INSEE's large
     census files do not — see :func:`_is_valid_parquet`).
     """
-    response = requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
-    response.raise_for_status()
-
-    total = int(response.headers.get("content-length", 0))
-    written = 0
-    with Progress(transient=True) as progress:
-        task = progress.add_task("Downloading", total=total or None)
-        with open(tmp, "wb") as f:
-            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                f.write(chunk)
-                written += len(chunk)
-                progress.advance(task, len(chunk))
+    # Closing the response hands its connection back to the pool even when
+    # the status check fails or the body breaks off mid-transfer.
+    with _HTTP.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+
+        total = int(response.headers.get("content-length", 0))
+        written = 0
+        with _shared_progress() as progress:
+            task = progress.add_task(
+                f"Downloading {tmp.name.removesuffix('.part')}", total=total or None
+            )
+            try:
+                with open(tmp, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+                        progress.advance(task, len(chunk))
+            finally:
+                progress.remove_task(task)
 
     if total and written != total:
         raise OSError(
@@ -661,6 +768,33 @@ def _stream_to_file(url: str, tmp: Path) -> int:
 # -----------------------------------------------------------------------------
 
 
+def _territory_rows(
+    aged: pd.DataFrame,
+    year: int,
+    department_code: str,
+    region_code: str,
+    canton_code: str,
+) -> pd.DataFrame:
+    """Shape aged (age, sex, population) census rows for the base table.
+
+    Overseas territories have no commune/IRIS breakdown, so every row gets the
+    territory's fixed geo codes and the no-geo IRIS sentinel.
+    """
+    return pd.DataFrame(
+        {
+            "year": year,
+            "department_code": department_code,
+            "region_code": region_code,
+            "canton_code": canton_code,
+            "commune_code": "",
+            "iris_code": IRIS_SENTINEL_NO_GEO,
+            "age": aged["age"].astype("int64").to_numpy(),
+            "sex": aged["sex"].to_numpy(),
+            "population": aged["population"].astype("float64").to_numpy(),
+        }
+    )
+
+
 def synthesize_mayotte_population(
     year: int,
     cache_dir: Path | None = None,
@@ -694,21 +828,7 @@ def synthesize_mayotte_population(
     if aged.empty:
         return pd.DataFrame()
 
-    rows: list[dict] = [
-        {
-            "year": year,
-            "department_code": "976",
-            "region_code": "06",
-            "canton_code": "9799",
-            "commune_code": "",
-            "iris_code": IRIS_SENTINEL_NO_GEO,
-            "age": int(r["age"]),
-            "sex": r["sex"],
-            "population": float(r["population"]),
-        }
-        for _, r in aged.iterrows()
-    ]
-    df = pd.DataFrame(rows)
+    df = _territory_rows(aged, year, "976", "06", "9799")
     logger.debug(
         "  Added {} Mayotte rows ({:,.0f} population)", len(df), df["population"].sum()
     )
@@ -730,15 +850,14 @@ def download_spm_pop1b(cache_dir: Path | None = None) -> pd.DataFrame:
     cache_path = cache_dir / "spm_pop1b_2022.parquet" if cache_dir else None
     if cache_path and cache_path.exists():
         logger.debug("Using cached SPM POP1B: {}", cache_path)
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         logger.info(
             "Downloading Saint-Pierre-et-Miquelon 2022 POP1B from {}", SPM_POP1B_URL
         )
-        response = requests.get(SPM_POP1B_URL, timeout=ESTIMATES_TIMEOUT)
-        response.raise_for_status()
-        xls_bytes = _extract_zip_member(response.content, SPM_POP1B_MEMBER)
+        with _fetch_to_spool(SPM_POP1B_URL) as archive:
+            xls_bytes = _extract_zip_member(archive, SPM_POP1B_MEMBER)
         df = _parse_pop1b_wide(xls_bytes, codgeo_prefix=SPM_CODGEO_PREFIX)
     except Exception as e:
         logger.warning("Could not fetch SPM POP1B: {}", e)
@@ -748,7 +867,7 @@ def download_spm_pop1b(cache_dir: Path | None = None) -> pd.DataFrame:
         return df
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
     return df
 
 
@@ -776,21 +895,7 @@ def synthesize_spm_population(
     if aged.empty:
         return pd.DataFrame()
 
-    rows: list[dict] = [
-        {
-            "year": year,
-            "department_code": "975",
-            "region_code": "975",
-            "canton_code": "9750",
-            "commune_code": "",
-            "iris_code": IRIS_SENTINEL_NO_GEO,
-            "age": int(r["age"]),
-            "sex": r["sex"],
-            "population": float(r["population"]),
-        }
-        for _, r in aged.iterrows()
-    ]
-    df = pd.DataFrame(rows)
+    df = _territory_rows(aged, year, "975", "975", "9750")
     logger.debug(
         "  Added {} SPM rows ({:,.0f} population)", len(df), df["population"].sum()
     )
@@ -837,20 +942,25 @@ def _expand_quinquennal_to_ages(
     Each band distributes its population uniformly across its ages. The open-
     ended last band spans [open_end_start, max_age].
     """
-    rows = []
-    for start, male, female in bands:
-        ages = (
-            range(open_end_start, max_age + 1)
-            if start >= open_end_start
-            else range(start, start + 5)
-        )
-        n = len(ages)
-        for age in ages:
-            if male > 0:
-                rows.append({"age": age, "sex": "male", "population": male / n})
-            if female > 0:
-                rows.append({"age": age, "sex": "female", "population": female / n})
-    return pd.DataFrame(rows)
+    if not bands:
+        return pd.DataFrame()
+    b = pd.DataFrame(bands, columns=["start", "male", "female"])
+    open_end = b["start"] >= open_end_start
+    first = b["start"].where(~open_end, open_end_start)
+    width = (max_age + 1 - first).where(open_end, 5).clip(lower=0)
+
+    # One row per (band, age), then per-age shares interleaved male/female.
+    expanded = b.loc[b.index.repeat(width)]
+    ages = first[expanded.index] + expanded.groupby(level=0).cumcount()
+    shares = expanded[["male", "female"]].div(width[expanded.index], axis=0)
+    long = (
+        shares.set_axis(pd.Index(ages.to_numpy(), name="age"))
+        .rename_axis(columns="sex")
+        .stack()
+        .rename("population")
+        .reset_index()
+    )
+    return long[long["population"] > 0].reset_index(drop=True)
 
 
 def download_wlf_census(cache_dir: Path | None = None) -> pd.DataFrame:
@@ -861,13 +971,12 @@ def download_wlf_census(cache_dir: Path | None = None) -> pd.DataFrame:
     """
     cache_path = cache_dir / "wlf_census_2023.parquet" if cache_dir else None
     if cache_path and cache_path.exists():
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         logger.info("Downloading Wallis-et-Futuna 2023 census from STSEE...")
-        response = requests.get(WLF_CENSUS_URL, timeout=ESTIMATES_TIMEOUT)
-        response.raise_for_status()
-        df = _parse_wlf_xlsx(response.content)
+        with _fetch_to_spool(WLF_CENSUS_URL) as workbook:
+            df = _parse_wlf_xlsx(workbook)
     except Exception as e:
         logger.warning("Could not fetch WLF census: {}", e)
         return pd.DataFrame()
@@ -876,11 +985,11 @@ def download_wlf_census(cache_dir: Path | None = None) -> pd.DataFrame:
         return df
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
     return df
 
 
-def _parse_wlf_xlsx(xlsx_bytes: bytes) -> pd.DataFrame:
+def _parse_wlf_xlsx(xlsx_bytes: bytes | IO[bytes]) -> pd.DataFrame:
     """Parse STSEE Wallis-et-Futuna census XLSX population table.
 
     Sheet "Tableau Pop_01" layout:
@@ -891,9 +1000,9 @@ def _parse_wlf_xlsx(xlsx_bytes: bytes) -> pd.DataFrame:
     """
     import openpyxl
 
-    wb = openpyxl.load_workbook(io.BytesIO(xlsx_bytes), read_only=True, data_only=True)
+    wb = openpyxl.load_workbook(_as_stream(xlsx_bytes), read_only=True, data_only=True)
     ws = wb["Tableau Pop_01"]
-    rows = list(ws.iter_rows(values_only=True))
+    rows = list(ws.iter_rows(max_col=24, values_only=True))
 
     bands: list[tuple[int, float, float]] = []
     open_end_start = 85
@@ -920,13 +1029,12 @@ def download_ncl_census(cache_dir: Path | None = None) -> pd.DataFrame:
     """
     cache_path = cache_dir / "ncl_census_2019.parquet" if cache_dir else None
     if cache_path and cache_path.exists():
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         logger.info("Downloading Nouvelle-Calédonie 2019 census from ISEE...")
-        response = requests.get(NCL_CENSUS_URL, timeout=ESTIMATES_TIMEOUT)
-        response.raise_for_status()
-        df = _parse_ncl_xls(response.content)
+        with _fetch_to_spool(NCL_CENSUS_URL) as workbook:
+            df = _parse_ncl_xls(workbook)
     except Exception as e:
         logger.warning("Could not fetch NCL census: {}", e)
         return pd.DataFrame()
@@ -935,11 +1043,11 @@ def download_ncl_census(cache_dir: Path | None = None) -> pd.DataFrame:
         return df
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
     return df
 
 
-def _parse_ncl_xls(xls_bytes: bytes) -> pd.DataFrame:
+def _parse_ncl_xls(xls_bytes: bytes | IO[bytes]) -> pd.DataFrame:
     """Parse ISEE Nouvelle-Calédonie 2019 XLS population table.
 
     Sheet "P02" layout:
@@ -948,16 +1056,23 @@ def _parse_ncl_xls(xls_bytes: bytes) -> pd.DataFrame:
       rows 4-20: age bands "0 à 4 ans" … "80 ans et +"
       col 10 = Hommes total NC, col 11 = Femmes total NC
     """
-    raw = pd.read_excel(io.BytesIO(xls_bytes), sheet_name="P02", header=None)
+    # Only the label and total-NC columns are needed; skip the province blocks.
+    raw = pd.read_excel(
+        _as_stream(xls_bytes),
+        sheet_name="P02",
+        header=None,
+        usecols=[0, 10, 11],
+        names=["label", "male", "female"],
+    )
     bands: list[tuple[int, float, float]] = []
     open_end_start = 80
-    for _, row in raw.iterrows():
-        label = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ""
+    for label_cell, male_cell, female_cell in raw.itertuples(index=False):
+        label = str(label_cell).strip() if not pd.isna(label_cell) else ""
         start = _QUINQUENNAL_LABELS.get(label)
         if start is None:
             continue
-        male = _safe_float(row.iloc[10])
-        female = _safe_float(row.iloc[11])
+        male = _safe_float(male_cell)
+        female = _safe_float(female_cell)
         if label == "80 ans et +":
             open_end_start = 80
         bands.append((start, male, female))
@@ -978,14 +1093,14 @@ def download_pyf_census(cache_dir: Path | None = None) -> pd.DataFrame:
         cache_dir / f"pyf_census_{PYF_CENSUS_YEAR}.parquet" if cache_dir else None
     )
     if cache_path and cache_path.exists():
-        return pd.read_parquet(cache_path)
+        return read_cached_frame(cache_path)
 
     try:
         logger.info(
             "Downloading Polynésie française {} demographics from data.gouv.fr...",
             PYF_CENSUS_YEAR,
         )
-        response = requests.get(PYF_CENSUS_URL, timeout=ESTIMATES_TIMEOUT)
+        response = _HTTP.get(PYF_CENSUS_URL, timeout=ESTIMATES_TIMEOUT)
         response.raise_for_status()
         df = _parse_pyf_csv(response.content)
     except Exception as e:
@@ -996,7 +1111,7 @@ def download_pyf_census(cache_dir: Path | None = None) -> pd.DataFrame:
         return df
     if cache_path and cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
     return df
 
 
@@ -1047,7 +1162,7 @@ def synthesize_tom_population(
     2022 base) the aging offset is floored at 0 — the census is used as-is
     rather than dropping the whole territory (≤1 year stale for ~11k people).
     """
-    allowed = set(departments) if departments is not None else set(DEPARTMENTS_TOM)
+    allowed = set(departments) if departments is not None else DEPARTMENTS_TOM_SET
     logger.info("Adding TOM Pacifique {} for year {}...", sorted(allowed), year)
 
     sources: list[tuple[str, str, int, object]] = [
@@ -1073,21 +1188,7 @@ def synthesize_tom_population(
         if aged.empty:
             continue
 
-        rows = [
-            {
-                "year": year,
-                "department_code": dept,
-                "region_code": "98",
-                "canton_code": f"{dept}9",
-                "commune_code": "",
-                "iris_code": IRIS_SENTINEL_NO_GEO,
-                "age": int(r["age"]),
-                "sex": r["sex"],
-                "population": float(r["population"]),
-            }
-            for _, r in aged.iterrows()
-        ]
-        part = pd.DataFrame(rows)
+        part = _territory_rows(aged, year, dept, "98", f"{dept}9")
         logger.debug(
             "  {} ({}) — {} rows, {:,.0f} population",
             dept,
@@ -19,6 +19,9 @@ distribution are applied on top identically for either method.
 
 from __future__ import annotations
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -28,9 +31,9 @@ from loguru import logger
 
 from passculture.data.insee_population import sql
 from passculture.data.insee_population.constants import (
-    DEPARTMENTS_DOM,
-    DEPARTMENTS_METRO,
-    DEPARTMENTS_TOM,
+    DEPARTMENTS_DOM_SET,
+    DEPARTMENTS_METRO_SET,
+    DEPARTMENTS_TOM_SET,
     IRIS_SENTINEL_NO_GEO,
     MAX_AGE,
 )
@@ -39,6 +42,7 @@ from passculture.data.insee_population.downloaders import (
     download_insee_estimates,
     download_mnai_birth_distribution,
     download_mobsco,
+    fetch_concurrently,
     synthesize_mayotte_population,
     synthesize_spm_population,
     synthesize_tom_population,
@@ -48,12 +52,14 @@ from passculture.data.insee_population.projections import (
     ProjectionMethod,
     apply_student_mobility_correction,
     apply_student_mobility_correction_iris,
+    compute_all_geo_ratios,
     compute_department_mobility_rates,
-    compute_geo_ratios,
+    load_mobsco_students,
     project_multi_year,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from typing import Any
 
 # Geo columns per level — used by SELECT_WITH_BIRTH_MONTH to expand
@@ -68,6 +74,32 @@ _GEO_COLUMNS = {
     ),
 }
 
+# Birth-month-expanded SELECT per level, formatted once at import.
+_LEVEL_SELECTS = {
+    level: sql.SELECT_WITH_BIRTH_MONTH.format(level=level, geo_columns=geo_columns)
+    for level, geo_columns in _GEO_COLUMNS.items()
+}
+
+
+# Output parquet settings: ZSTD gives noticeably smaller files than DuckDB's
+# default Snappy for these repetitive code/date columns at similar read speed.
+_PARQUET_COPY_OPTIONS = "FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 3"
+
+# Tables only consumed while projecting; dropped afterwards so DuckDB can
+# release their blocks (geo_ratios_iris alone is IRIS x age band x sex).
+# monthly_births/population are still read by exports and validate().
+_PROJECTION_SCRATCH_TABLES = (
+    "geo_ratios_epci",
+    "geo_ratios_canton",
+    "geo_ratios_iris",
+    "geo_ratios_epci_base",
+    "geo_ratios_iris_base",
+    "student_flows_epci",
+    "student_flows_iris",
+    "mobility_weights",
+    "insee_estimates",
+)
+
 
 class PopulationProcessor:
     """DuckDB-based INSEE population processor.
@@ -79,11 +111,11 @@ class PopulationProcessor:
     - population_iris: 100% pop coverage; ~60% has sub-commune spatial resolution
 
     Example:
-        processor = PopulationProcessor(year=2022, min_age=15, max_age=24,
-                                        start_year=2015, end_year=2030)
-        processor.download_and_process()
-        processor.create_multi_level_tables()
-        processor.save_multi_level("output/")
+        with PopulationProcessor(year=2022, min_age=15, max_age=24,
+                                 start_year=2015, end_year=2030) as processor:
+            processor.download_and_process()
+            processor.create_multi_level_tables()
+            processor.save_multi_level("output/")
     """
 
     def __init__(
@@ -101,8 +133,23 @@ class PopulationProcessor:
         monthly: bool = False,
         method: ProjectionMethod = "cohort-estimates",
         cache_dir: str | Path | None = "data/cache",
+        *,
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        spill: bool = True,
     ) -> None:
-        """Initialize processor with filtering options."""
+        """Initialize processor with filtering options.
+
+        ``threads`` and ``memory_limit`` (e.g. ``"8GB"``) are passed to the
+        DuckDB session; ``None`` keeps DuckDB's defaults (all cores, 80% of
+        RAM). Insertion order is not preserved, so any query whose row order
+        matters downstream must carry its own ``ORDER BY``.
+
+        With ``spill=False`` DuckDB never writes to disk: large joins and
+        aggregations skip the serialise/partition work of out-of-core
+        operators, but fail with an out-of-memory error past
+        ``memory_limit``. Only use it when the run fits in RAM.
+        """
         self.year = year
         self.min_age = min_age
         self.max_age = max_age
@@ -138,17 +185,37 @@ class PopulationProcessor:
 
         self.conn = duckdb.connect()
         self.conn.execute("SET preserve_insertion_order=false")
+        if threads is not None:
+            self.conn.execute("SET threads = ?", [threads])
+        if memory_limit is not None:
+            self.conn.execute("SET memory_limit = ?", [memory_limit])
         # Allow DuckDB to spill to disk when in-memory tables exceed RAM
-        if self.cache_dir:
+        if not spill:
+            self.conn.execute("SET temp_directory = ''")
+        elif self.cache_dir:
             temp_dir = Path(self.cache_dir) / "duckdb_temp"
             temp_dir.mkdir(parents=True, exist_ok=True)
-            self.conn.execute(f"SET temp_directory='{temp_dir}'")
+            self.conn.execute("SET temp_directory = ?", [str(temp_dir)])
         self._base_table_created = False
         self._geo_mappings_loaded = False
 
+    def __enter__(self) -> PopulationProcessor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the DuckDB connection, releasing its memory and spill files.
+
+        Safe to call more than once; the processor is unusable afterwards.
+        """
+        self.conn.close()
+
     def download_and_process(self) -> PopulationProcessor:
         """Download INDCVI census data and create base population table."""
-        parquet_path = download_indcvi(self.year, self.cache_dir)
+        sources = self._fetch_sources()
+        parquet_path = sources["indcvi"]
 
         logger.info(
             "Processing INDCVI {} (ages {}-{})...",
@@ -158,27 +225,70 @@ class PopulationProcessor:
         )
         self._execute(
             sql.CREATE_BASE_TABLE.format(
-                parquet_path=parquet_path,
                 where_clause=self._build_where_clause(),
                 year=self.year,
                 iris_sentinel_no_geo=IRIS_SENTINEL_NO_GEO,
-            )
+            ),
+            [str(parquet_path)],
         )
 
         logger.info("Base table: {:,} rows", self._row_count())
         self._base_table_created = True
 
         if self.include_mayotte:
-            self._add_mayotte()
+            self._add_mayotte(sources["mayotte"])
 
         if self.include_tom:
-            self._add_tom()
+            self._add_tom(sources["tom"])
 
         if self.include_com:
-            self._add_spm()
+            self._add_spm(sources["spm"])
 
         return self
 
+    def _fetch_sources(self) -> dict[str, Any]:
+        """Fetch the census parquet and enabled overseas sources concurrently.
+
+        The sources are independent, so the small territory downloads overlap
+        the large INDCVI transfer instead of queueing behind it.
+        """
+        jobs: dict[str, Callable[[], Any]] = {
+            "indcvi": partial(download_indcvi, self.year, self.cache_dir)
+        }
+        if self.include_mayotte:
+            jobs["mayotte"] = partial(
+                synthesize_mayotte_population, self.year, cache_dir=self.cache_dir
+            )
+        if self.include_tom:
+            jobs["tom"] = partial(
+                synthesize_tom_population, self.year, cache_dir=self.cache_dir
+            )
+        if self.include_com:
+            jobs["spm"] = partial(
+                synthesize_spm_population, self.year, cache_dir=self.cache_dir
+            )
+        return fetch_concurrently(jobs)
+
+    def _fetch_projection_inputs(self) -> dict[str, Any]:
+        """Fetch geo mappings, MNAI, MOBSCO and INSEE estimates concurrently.
+
+        Geo mappings are skipped once loaded; MOBSCO and the estimates are
+        only requested when the student mobility correction or the
+        cohort-estimates method needs them.
+        """
+        jobs: dict[str, Callable[[], Any]] = {
+            "monthly_births": partial(
+                download_mnai_birth_distribution, self.year, self.cache_dir
+            )
+        }
+        if not self._geo_mappings_loaded:
+            jobs["geo_mappings"] = partial(get_geo_mappings, self.cache_dir)
+        if self.correct_student_mobility:
+            jobs["mobsco"] = partial(download_mobsco, self.cache_dir)
+        if self.method == "cohort-estimates":
+            jobs["insee_estimates"] = partial(download_insee_estimates, self.cache_dir)
+        return fetch_concurrently(jobs)
+
     def create_multi_level_tables(self) -> PopulationProcessor:
         """Create population tables at department, EPCI, canton, and IRIS levels.
 
@@ -191,14 +301,19 @@ class PopulationProcessor:
         - month, snapshot_month, born_date, decimal_age
         """
         self._ensure_base_table()
-        self._load_geo_mappings()
-        return self._create_projected_tables()
+        inputs = self._fetch_projection_inputs()
+        if "geo_mappings" in inputs:
+            self._load_geo_mappings(*inputs["geo_mappings"])
+        return self._create_projected_tables(inputs)
 
-    def _create_projected_tables(self) -> PopulationProcessor:
+    def _create_projected_tables(self, inputs: dict[str, Any]) -> PopulationProcessor:
         """Create multi-year projected tables with monthly granularity.
 
         Uses simple census aging: population at age A in year Y equals
         the census population at age A-(Y-census_year).
+
+        Args:
+            inputs: Downloaded sources from ``_fetch_projection_inputs``
         """
         sy, ey = self.start_year, self.end_year
         logger.info(
@@ -211,45 +326,46 @@ class PopulationProcessor:
         # handles both by falling back within INDREG itself to the regional
         # and metropolitan aggregates.
         logger.info("Step 1: Loading monthly birth distribution (MNAI)...")
-        monthly_births_df = download_mnai_birth_distribution(self.year, self.cache_dir)
+        monthly_births_df = inputs["monthly_births"]
         if monthly_births_df.empty:
             raise RuntimeError(
                 "INDREG MNAI is unavailable — cannot compute monthly "
                 "birth distribution. Check data/cache or network access."
             )
-        self._register_dataframe("monthly_births_df", monthly_births_df)
-        self._execute(sql.REGISTER_MONTHLY_BIRTHS)
+        self._load_dataframe(
+            "monthly_births_df", monthly_births_df, sql.REGISTER_MONTHLY_BIRTHS
+        )
 
         # 2. Compute geographic ratios
         logger.info("Step 2: Computing geographic ratios...")
-        compute_geo_ratios(self.conn, "epci")
-        compute_geo_ratios(self.conn, "canton")
-        compute_geo_ratios(self.conn, "iris")
+        compute_all_geo_ratios(self.conn)
 
         # 2b. Apply student mobility correction to EPCI and IRIS geo ratios
         if self.correct_student_mobility:
             logger.info("Step 2b: Computing department mobility rates...")
-            mobsco_path = download_mobsco(self.cache_dir)
-            compute_department_mobility_rates(self.conn, mobsco_path)
+            load_mobsco_students(self.conn, inputs["mobsco"])
+            compute_department_mobility_rates(self.conn)
 
             logger.info("Step 2c: Correcting EPCI geo ratios for student mobility...")
-            apply_student_mobility_correction(self.conn, mobsco_path)
+            apply_student_mobility_correction(self.conn)
 
             logger.info("Step 2d: Correcting IRIS geo ratios for student mobility...")
-            apply_student_mobility_correction_iris(self.conn, mobsco_path)
+            apply_student_mobility_correction_iris(self.conn)
+            self._execute("DROP TABLE IF EXISTS mobsco_students")
 
         # 2e. cohort-estimates: load INSEE annual estimates to anchor totals.
         if self.method == "cohort-estimates":
             logger.info("Step 2e: Loading INSEE population estimates (anchor)...")
-            insee_df = download_insee_estimates(self.cache_dir)
+            insee_df = inputs["insee_estimates"]
             if insee_df.empty:
                 logger.warning(
                     "INSEE estimates unavailable — cohort-estimates will fall "
                     "back to frozen cohort-stable totals."
                 )
             else:
-                self._register_dataframe("insee_estimates_df", insee_df)
-                self._execute(sql.REGISTER_INSEE_ESTIMATES)
+                self._load_dataframe(
+                    "insee_estimates_df", insee_df, sql.REGISTER_INSEE_ESTIMATES
+                )
 
         # 3. Project multi-year at all levels
         logger.info("Step 3: Projecting population (method={})...", self.method)
@@ -264,6 +380,10 @@ class PopulationProcessor:
             method=self.method,
         )
 
+        # 4. Release scratch inputs nobody reads once projections exist
+        for table in _PROJECTION_SCRATCH_TABLES:
+            self._execute(f"DROP TABLE IF EXISTS {table}")
+
         return self
 
     def _level_select(self, level: str, *, yearly: bool = False) -> str:
@@ -275,10 +395,7 @@ class PopulationProcessor:
                 downsample a monthly-built table to yearly resolution at
                 export time (12x fewer rows).
         """
-        select = sql.SELECT_WITH_BIRTH_MONTH.format(
-            level=level,
-            geo_columns=_GEO_COLUMNS[level],
-        )
+        select = _LEVEL_SELECTS[level]
         if yearly:
             # SELECT_WITH_BIRTH_MONTH ends with a WHERE clause, so AND-append.
             select += "\n    AND pd.month = 1"
@@ -302,11 +419,16 @@ class PopulationProcessor:
             The destination path.
         """
         path = Path(path)
-        select = self._level_select(level, yearly=yearly)
-        self._execute(f"COPY ({select}) TO '{path}' (FORMAT PARQUET)")
+        self._copy_level(self.conn, level, path, yearly=yearly)
         return path
 
-    def save_multi_level(self, output_dir: str | Path) -> dict[str, Path]:
+    def save_multi_level(
+        self,
+        output_dir: str | Path,
+        *,
+        max_workers: int = 1,
+        partition_by: Sequence[str] | None = None,
+    ) -> dict[str, Path]:
         """Save all multi-level tables to parquet files.
 
         Birth-month expansion (12 sub-rows per cohort) is applied on-the-fly
@@ -315,19 +437,36 @@ class PopulationProcessor:
 
         Args:
             output_dir: Directory to save the files
+            max_workers: Number of levels written at once, each on its own
+                cursor. DuckDB already parallelises a single COPY, so this
+                mainly helps when parquet encoding or disk writes dominate.
+            partition_by: Output columns (e.g. ``("year",)``) to hive-partition
+                each level on. Each level is then written as a
+                ``population_{level}/`` directory of ``col=value/`` files so
+                readers filtering on those columns skip the other partitions.
 
         Returns:
-            Dict mapping level name to file path
+            Dict mapping level name to file (or partition directory) path
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        paths = {}
-        for level in ["department", "epci", "canton", "iris"]:
-            path = output_dir / f"population_{level}.parquet"
-            self.copy_level_to_parquet(level, path)
-            paths[level] = path
+        suffix = "" if partition_by else ".parquet"
+        paths = {
+            level: output_dir / f"population_{level}{suffix}"
+            for level in ["department", "epci", "canton", "iris"]
+        }
+        if max_workers <= 1:
+            for level, path in paths.items():
+                self._copy_level(self.conn, level, path, partition_by=partition_by)
+            return paths
+
+        def write(level: str) -> None:
+            with self.conn.cursor() as cursor:
+                self._copy_level(cursor, level, paths[level], partition_by=partition_by)
 
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(write, paths))
         return paths
 
     def to_pandas(self, level: str = "department") -> pd.DataFrame:
@@ -350,23 +489,22 @@ class PopulationProcessor:
             "stats": {},
         }
 
+        cursor = self._execute(sql.GET_VALIDATION_STATS)
+        columns = [d[0] for d in cursor.description]
+        stats = dict(zip(columns, cursor.fetchone(), strict=True))
+
         # Check for invalid populations
-        nulls = self._fetchone(sql.COUNT_INVALID_POPULATION)
+        nulls = stats.pop("invalid_rows")
         if nulls > 0:
             results["errors"].append(
                 f"Found {nulls} rows with null/negative population"
             )
             results["is_valid"] = False
 
-        # Gather statistics
-        results["stats"] = (
-            self._execute(sql.GET_VALIDATION_STATS).df().iloc[0].to_dict()
-        )
+        results["stats"] = stats
 
         # Check department coverage
-        present = set(
-            self._execute(sql.GET_DISTINCT_DEPARTMENTS).df()["department_code"].tolist()
-        )
+        present = set(stats.pop("department_codes") or ())
         self._check_department_coverage(present, results)
 
         return results
@@ -375,9 +513,33 @@ class PopulationProcessor:
     # Private helpers
     # -------------------------------------------------------------------------
 
-    def _execute(self, query: str) -> duckdb.DuckDBPyRelation:
-        """Execute SQL query."""
-        return self.conn.execute(query)
+    def _execute(
+        self, query: str, params: list[Any] | None = None
+    ) -> duckdb.DuckDBPyConnection:
+        """Execute SQL query, binding ``params`` to its ``?`` placeholders."""
+        return self.conn.execute(query, params)
+
+    def _copy_level(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        level: str,
+        path: Path,
+        *,
+        yearly: bool = False,
+        partition_by: Sequence[str] | None = None,
+    ) -> None:
+        """COPY one level's expanded rows to ``path`` on the given connection."""
+        select = self._level_select(level, yearly=yearly)
+        options = _PARQUET_COPY_OPTIONS
+        if partition_by:
+            # Replace the previous export the way a single-file COPY does:
+            # partitions left from an earlier run (other years, another
+            # thread count) would otherwise be read alongside the new ones.
+            if path.exists():
+                shutil.rmtree(path)
+            columns = ", ".join(partition_by)
+            options += f", PARTITION_BY ({columns})"
+        conn.execute(f"COPY ({select}) TO ? ({options})", [str(path)])
 
     def _fetchone(self, query: str) -> Any:
         """Execute query and return first value."""
@@ -387,6 +549,19 @@ class PopulationProcessor:
         """Register DataFrame as DuckDB table."""
         self.conn.register(name, df)
 
+    def _load_dataframe(self, name: str, df: pd.DataFrame, query: str) -> None:
+        """Run ``query`` against ``df`` registered as ``name``, then unregister.
+
+        Each loader copies its frame into a real table (or the base table), so
+        the view is dropped right away instead of pinning the frame for the
+        life of the connection.
+        """
+        self._register_dataframe(name, df)
+        try:
+            self._execute(query)
+        finally:
+            self.conn.unregister(name)
+
     def _row_count(self) -> int:
         """Get current population table row count."""
         return self._fetchone(sql.GET_ROW_COUNT)
@@ -410,65 +585,55 @@ class PopulationProcessor:
             filters.append("DEPT NOT IN ('975', '977', '978')")
         return "WHERE " + " AND ".join(filters) if filters else ""
 
-    def _add_mayotte(self) -> None:
+    def _add_mayotte(self, mayotte_df: pd.DataFrame) -> None:
         """Add Mayotte data from POP1B census (raw, aged forward)."""
-        mayotte_df = synthesize_mayotte_population(self.year, cache_dir=self.cache_dir)
         if mayotte_df.empty:
             raise RuntimeError(
                 "Mayotte POP1B is unavailable — use --no-mayotte to skip it."
             )
-        self._register_dataframe("mayotte_df", mayotte_df)
-        self._execute(sql.INSERT_MAYOTTE)
+        self._load_dataframe("mayotte_df", mayotte_df, sql.INSERT_MAYOTTE)
 
-    def _add_tom(self) -> None:
+    def _add_tom(self, tom_df: pd.DataFrame) -> None:
         """Add TOM Pacifique data from territory censuses (aged forward)."""
-        tom_df = synthesize_tom_population(self.year, cache_dir=self.cache_dir)
         if tom_df.empty:
             raise RuntimeError(
                 "All TOM Pacifique censuses unavailable — use --no-tom to skip."
             )
-        self._register_dataframe("tom_df", tom_df)
-        self._execute(sql.INSERT_TOM)
+        self._load_dataframe("tom_df", tom_df, sql.INSERT_TOM)
 
-    def _add_spm(self) -> None:
+    def _add_spm(self, spm_df: pd.DataFrame) -> None:
         """Add Saint-Pierre-et-Miquelon (975) from its 2022 POP1B census.
 
         Best-effort: a missing/unparsable SPM source is logged and skipped
         rather than failing the run (SPM is ~0.007% of the eligible population).
         """
-        spm_df = synthesize_spm_population(self.year, cache_dir=self.cache_dir)
         if spm_df.empty:
             logger.warning("Saint-Pierre-et-Miquelon (975) unavailable — skipping.")
             return
-        self._register_dataframe("spm_df", spm_df)
-        self._execute(sql.INSERT_SPM)
+        self._load_dataframe("spm_df", spm_df, sql.INSERT_SPM)
 
-    def _load_geo_mappings(self) -> None:
+    def _load_geo_mappings(
+        self, commune_epci: pd.DataFrame, canton_weights: pd.DataFrame
+    ) -> None:
         """Load commune→EPCI and canton→EPCI weight mappings."""
-        if self._geo_mappings_loaded:
-            return
+        self._load_dataframe("commune_epci_df", commune_epci, sql.REGISTER_COMMUNE_EPCI)
 
-        commune_epci, canton_weights = get_geo_mappings(self.cache_dir)
-
-        self._register_dataframe("commune_epci_df", commune_epci)
-        self._execute(sql.REGISTER_COMMUNE_EPCI)
-
-        self._register_dataframe("canton_weights_df", canton_weights)
-        self._execute(sql.REGISTER_CANTON_WEIGHTS)
+        self._load_dataframe(
+            "canton_weights_df", canton_weights, sql.REGISTER_CANTON_WEIGHTS
+        )
 
         self._geo_mappings_loaded = True
 
     def _check_department_coverage(self, present: set[str], results: dict) -> None:
         """Check department coverage and add warnings."""
-        missing_metro = set(DEPARTMENTS_METRO) - present
+        missing_metro = DEPARTMENTS_METRO_SET - present
         if missing_metro:
             results["warnings"].append(
                 f"Missing metro departments: {sorted(missing_metro)}"
             )
 
-        expected_dom = set(DEPARTMENTS_DOM)
-        present_dom = expected_dom & present
-        missing_dom = expected_dom - present
+        present_dom = DEPARTMENTS_DOM_SET & present
+        missing_dom = DEPARTMENTS_DOM_SET - present
         results["stats"]["dom_present"] = list(present_dom)
         if missing_dom:
             results["warnings"].append(
@@ -477,8 +642,8 @@ class PopulationProcessor:
 
         results["stats"]["mayotte_present"] = "976" in present
 
-        present_tom = set(DEPARTMENTS_TOM) & present
-        missing_tom = set(DEPARTMENTS_TOM) - present
+        present_tom = DEPARTMENTS_TOM_SET & present
+        missing_tom = DEPARTMENTS_TOM_SET - present
         results["stats"]["tom_present"] = sorted(present_tom)
         if missing_tom:
             results["warnings"].append(
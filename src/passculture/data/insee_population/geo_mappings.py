@@ -7,12 +7,21 @@ Downloads and caches:
 
 from __future__ import annotations
 
+import tempfile
 from pathlib import Path
 
+import duckdb
 import pandas as pd
 import requests
 from loguru import logger
 
+from passculture.data.insee_population import sql
+from passculture.data.insee_population.constants import CACHE_PARQUET_WRITE_OPTIONS
+from passculture.data.insee_population.downloaders import (
+    download_file,
+    read_cached_frame,
+)
+
 # API endpoints
 GEO_API_COMMUNES_URL = "https://geo.api.gouv.fr/communes?fields=code,nom,codeDepartement,codeEpci,population&format=json"
 COG_COMMUNES_URL = (
@@ -25,6 +34,15 @@ CANTON_EPCI_CACHE = "canton_epci_weights.parquet"
 
 DOWNLOAD_TIMEOUT = 120
 
+# geo.api.gouv.fr field -> output column, in output order
+_GEO_API_COLUMNS = {
+    "code": "commune_code",
+    "codeEpci": "epci_code",
+    "nom": "commune_name",
+    "codeDepartement": "department_code",
+    "population": "commune_population",
+}
+
 # Paris, Lyon, Marseille arrondissements → parent commune EPCI
 # These are sub-divisions not in standard commune list
 ARRONDISSEMENT_EPCI = {
@@ -46,41 +64,31 @@ def download_commune_epci_mapping(cache_dir: Path | None = None) -> pd.DataFrame
     if cache_dir:
         cache_path = cache_dir / COMMUNE_EPCI_CACHE
         if cache_path.exists():
-            return pd.read_parquet(cache_path)
+            return read_cached_frame(cache_path)
 
     logger.info("Downloading commune -> EPCI mapping from geo.api.gouv.fr...")
     response = requests.get(GEO_API_COMMUNES_URL, timeout=DOWNLOAD_TIMEOUT)
     response.raise_for_status()
 
-    data = response.json()
-    df = pd.DataFrame(
-        [
-            {
-                "commune_code": c["code"],
-                "epci_code": c.get("codeEpci"),
-                "commune_name": c.get("nom"),
-                "department_code": c.get("codeDepartement"),
-                "commune_population": c.get("population", 0),
-            }
-            for c in data
-        ]
+    # Build column-wise from the JSON records instead of one dict per commune
+    df = pd.DataFrame(response.json(), columns=list(_GEO_API_COLUMNS)).rename(
+        columns=_GEO_API_COLUMNS
     )
+    df["commune_population"] = df["commune_population"].fillna(0).astype("int64")
 
     # Filter to communes with EPCI
-    df = df[df["epci_code"].notna()].copy()
+    df = df[df["epci_code"].notna()]
 
     # Add Paris/Lyon/Marseille arrondissements
+    codes = list(ARRONDISSEMENT_EPCI)
     arrondissements = pd.DataFrame(
-        [
-            {
-                "commune_code": code,
-                "epci_code": epci,
-                "commune_name": f"Arrondissement {code}",
-                "department_code": code[:2],
-                "commune_population": 0,
-            }
-            for code, epci in ARRONDISSEMENT_EPCI.items()
-        ]
+        {
+            "commune_code": codes,
+            "epci_code": list(ARRONDISSEMENT_EPCI.values()),
+            "commune_name": [f"Arrondissement {code}" for code in codes],
+            "department_code": [code[:2] for code in codes],
+            "commune_population": 0,
+        }
     )
     df = pd.concat([df, arrondissements], ignore_index=True)
 
@@ -91,7 +99,7 @@ def download_commune_epci_mapping(cache_dir: Path | None = None) -> pd.DataFrame
 
     if cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(cache_path, index=False)
+        df.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
 
     return df
 
@@ -108,54 +116,22 @@ def download_canton_epci_weights(cache_dir: Path | None = None) -> pd.DataFrame:
     if cache_dir:
         cache_path = cache_dir / CANTON_EPCI_CACHE
         if cache_path.exists():
-            return pd.read_parquet(cache_path)
+            return read_cached_frame(cache_path)
 
     logger.info("Building canton -> EPCI weights...")
 
-    # Get COG with canton codes
-    logger.info("  Downloading COG communes...")
-    cog = pd.read_csv(COG_COMMUNES_URL, dtype=str)
-    cog = cog[["COM", "DEP", "CAN"]].rename(
-        columns={
-            "COM": "commune_code",
-            "DEP": "department_code",
-            "CAN": "canton_code",
-        }
-    )
-
     # Get commune → EPCI mapping
     commune_epci = download_commune_epci_mapping(cache_dir)
 
-    # Join to get canton + EPCI for each commune
-    merged = cog.merge(
-        commune_epci[["commune_code", "epci_code", "commune_population"]],
-        on="commune_code",
-        how="inner",
-    )
-    merged["commune_population"] = pd.to_numeric(
-        merged["commune_population"], errors="coerce"
-    ).fillna(0)
-
-    # Aggregate by canton + EPCI
-    canton_epci = (
-        merged.groupby(["canton_code", "epci_code"])
-        .agg({"commune_population": "sum"})
-        .reset_index()
-    )
-
-    # Calculate weights within each canton
-    canton_totals = (
-        canton_epci.groupby("canton_code")["commune_population"].sum().reset_index()
-    )
-    canton_totals.columns = ["canton_code", "canton_total"]
-
-    canton_epci = canton_epci.merge(canton_totals, on="canton_code")
-    canton_epci["weight"] = (
-        canton_epci["commune_population"] / canton_epci["canton_total"]
-    )
-    canton_epci["weight"] = canton_epci["weight"].fillna(0)
+    # Stream the COG CSV to disk and let DuckDB parse it, then join,
+    # aggregate by canton + EPCI and normalise within each canton in SQL
+    with tempfile.TemporaryDirectory() as tmp, duckdb.connect() as conn:
+        cog_path = Path(tmp) / "cog_communes.csv"
+        download_file(COG_COMMUNES_URL, cog_path)
 
-    result = canton_epci[["canton_code", "epci_code", "weight"]].copy()
+        conn.execute(sql.LOAD_COG_CANTONS, [str(cog_path)])
+        conn.register("commune_epci", commune_epci)
+        result = conn.execute(sql.CANTON_EPCI_WEIGHTS).df()
 
     n_cantons = result["canton_code"].nunique()
     n_epcis = result["epci_code"].nunique()
@@ -163,7 +139,7 @@ def download_canton_epci_weights(cache_dir: Path | None = None) -> pd.DataFrame:
 
     if cache_dir:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        result.to_parquet(cache_path, index=False)
+        result.to_parquet(cache_path, **CACHE_PARQUET_WRITE_OPTIONS)
 
     return result
 
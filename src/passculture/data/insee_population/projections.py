@@ -10,6 +10,7 @@ corrections are applied on top of the department-level projection.
 from __future__ import annotations
 
 import time
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
@@ -38,19 +39,25 @@ from passculture.data.insee_population.constants import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import duckdb
 
 ProjectionMethod = Literal["cohort-estimates", "cohort-stable", "cohort-aging"]
 
 
-def _build_age_band_cases() -> str:
-    """Build SQL CASE expression mapping age -> age_band from AGE_BUCKETS."""
-    cases = []
-    for band_name, age_range in AGE_BUCKETS.items():
-        min_age = min(age_range)
-        max_age = max(age_range)
-        cases.append(f"WHEN age BETWEEN {min_age} AND {max_age} THEN '{band_name}'")
-    return "\n            ".join(cases)
+def _build_age_band_expr() -> str:
+    """Build a branch-free SQL expression mapping age -> age_band from AGE_BUCKETS.
+
+    Bands are contiguous and uniform-width from age 0 (the last one open-ended),
+    so the band index is plain integer arithmetic and the label a list lookup.
+    """
+    starts = [min(age_range) for age_range in AGE_BUCKETS.values()]
+    width = starts[1] - starts[0]
+    if starts != list(range(0, width * len(starts), width)):
+        raise ValueError("AGE_BUCKETS must be uniform-width bands starting at 0")
+    labels = ", ".join(f"'{band_name}'" for band_name in AGE_BUCKETS)
+    return f"[{labels}][LEAST(age // {width}, {len(starts) - 1}) + 1]"
 
 
 _GEO_RATIO_CONFIG = {
@@ -75,6 +82,20 @@ _GEO_RATIO_CONFIG = {
 }
 
 
+def _table_summary(
+    conn: duckdb.DuckDBPyConnection, table: str, distinct_col: str, label: str
+) -> str:
+    """Describe ``table`` as "N rows across M <label>" for debug logs.
+
+    The DISTINCT count scans the whole table, so callers pass this to
+    ``logger.opt(lazy=True)`` and it only runs when DEBUG is enabled.
+    """
+    count, n_distinct = conn.execute(
+        f"SELECT COUNT(*), COUNT(DISTINCT {distinct_col}) FROM {table}"
+    ).fetchone()
+    return f"{count:,} rows across {n_distinct} {label}"
+
+
 def compute_geo_ratios(conn: duckdb.DuckDBPyConnection, level: str) -> None:
     """Compute geographic share within each dept/age_band/sex from INDCVI.
 
@@ -85,30 +106,47 @@ def compute_geo_ratios(conn: duckdb.DuckDBPyConnection, level: str) -> None:
         conn: DuckDB connection with `population` and `commune_epci` tables
         level: 'epci', 'canton', or 'iris'
     """
-    if level not in _GEO_RATIO_CONFIG:
-        raise ValueError(f"Unknown level: {level}")
+    compute_all_geo_ratios(conn, (level,))
+
+
+def compute_all_geo_ratios(
+    conn: duckdb.DuckDBPyConnection,
+    levels: Sequence[str] = ("epci", "canton", "iris"),
+) -> None:
+    """Compute geo ratios for several levels from one banded population scan.
+
+    The base `population` table is aggregated to age bands once into a
+    temporary `population_banded` table, which every level then reads.
+
+    Args:
+        conn: DuckDB connection with `population` and `commune_epci` tables
+        levels: Any of 'epci', 'canton', 'iris'
+    """
+    unknown = [level for level in levels if level not in _GEO_RATIO_CONFIG]
+    if unknown:
+        raise ValueError(f"Unknown level: {unknown[0]}")
 
-    sql_template, table, distinct_col, label = _GEO_RATIO_CONFIG[level]
-    age_band_cases = _build_age_band_cases()
     conn.execute(
-        sql_template.format(
-            age_band_cases=age_band_cases,
+        sql.CREATE_BANDED_POPULATION.format(
+            age_band_expr=_build_age_band_expr(),
             max_age=MAX_AGE,
-            iris_sentinel_no_geo=IRIS_SENTINEL_NO_GEO,
-            iris_sentinel_masked_suffix=IRIS_SENTINEL_MASKED_SUFFIX,
         )
     )
-    count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-    n_geo = conn.execute(
-        f"SELECT COUNT(DISTINCT {distinct_col}) FROM {table}"
-    ).fetchone()[0]
-    logger.debug(
-        "  {} geo ratios: {:,} rows across {} {}",
-        level.upper(),
-        count,
-        n_geo,
-        label,
-    )
+    try:
+        for level in levels:
+            sql_template, table, distinct_col, label = _GEO_RATIO_CONFIG[level]
+            conn.execute(
+                sql_template.format(
+                    iris_sentinel_no_geo=IRIS_SENTINEL_NO_GEO,
+                    iris_sentinel_masked_suffix=IRIS_SENTINEL_MASKED_SUFFIX,
+                )
+            )
+            logger.opt(lazy=True).debug(
+                f"  {level.upper()} geo ratios: {{}}",
+                partial(_table_summary, conn, table, distinct_col, label),
+            )
+    finally:
+        conn.execute("DROP TABLE IF EXISTS population_banded")
 
 
 def _apply_insee_anchor(conn: duckdb.DuckDBPyConnection) -> None:
@@ -184,9 +222,8 @@ def project_multi_year(
     Requires these tables to already exist in the connection:
     - `population`: from download_and_process (INDCVI census)
     - `monthly_births`: from download_mnai_birth_distribution
-    - `geo_ratios_epci`: from compute_geo_ratios('epci')
-    - `geo_ratios_canton`: from compute_geo_ratios('canton')
-    - `geo_ratios_iris`: from compute_geo_ratios('iris')
+    - `geo_ratios_epci`, `geo_ratios_canton`, `geo_ratios_iris`: from
+      compute_all_geo_ratios (or compute_geo_ratios per level)
 
     Creates: `population_department`, `population_epci`, `population_canton`,
              `population_iris`
@@ -201,7 +238,7 @@ def project_multi_year(
         method,
     )
 
-    age_band_cases = _build_age_band_cases()
+    age_band_expr = _build_age_band_expr()
     ci_params = {
         "census_year": census_year,
         "ci_base_near": CI_BASE_NEAR,
@@ -277,7 +314,7 @@ def project_multi_year(
         "EPCI geo join",
         lambda: conn.execute(
             sql.CREATE_PROJECTED_EPCI.format(
-                age_band_cases=age_band_cases,
+                age_band_expr=age_band_expr,
                 ci_extra_epci=CI_EXTRA_EPCI,
                 max_age=MAX_AGE,
             )
@@ -287,7 +324,7 @@ def project_multi_year(
         "Canton geo join",
         lambda: conn.execute(
             sql.CREATE_PROJECTED_CANTON.format(
-                age_band_cases=age_band_cases,
+                age_band_expr=age_band_expr,
                 ci_extra_canton=CI_EXTRA_CANTON,
                 max_age=MAX_AGE,
             )
@@ -297,7 +334,7 @@ def project_multi_year(
         "IRIS geo join",
         lambda: conn.execute(
             sql.CREATE_PROJECTED_IRIS.format(
-                age_band_cases=age_band_cases,
+                age_band_expr=age_band_expr,
                 ci_extra_iris=CI_EXTRA_IRIS,
                 max_age=MAX_AGE,
             )
@@ -309,59 +346,39 @@ def project_multi_year(
     # SELECT_WITH_BIRTH_MONTH to avoid materialising hundreds of millions
     # of rows in memory.
 
-    # Print statistics (compact table sizes)
-    dept_stats = conn.execute("""
-        SELECT COUNT(*), SUM(population),
-               COUNT(DISTINCT year), COUNT(DISTINCT department_code)
-        FROM population_department
-    """).fetchone()
-    dept_count, dept_pop, n_years, n_depts = dept_stats
-    n_months = conn.execute(
-        "SELECT COUNT(DISTINCT month) FROM population_department"
-    ).fetchone()[0]
-    avg_pop = float(dept_pop) / (n_years * n_months) if n_years and n_months else 0
-    logger.debug(
-        "  Department: {:,} rows (x12 at export), "
-        "{} years, {} depts, "
-        "avg {:,.0f} pop/month",
-        dept_count,
-        n_years,
-        n_depts,
-        avg_pop,
-    )
-
-    epci_stats = conn.execute("""
-        SELECT COUNT(*), SUM(population), COUNT(DISTINCT epci_code)
-        FROM population_epci
-    """).fetchone()
-    epci_count, _epci_pop, n_epcis = epci_stats
-    logger.debug("  EPCI: {:,} rows, {} EPCIs", epci_count, n_epcis)
+    # Print statistics (compact table sizes). These scan every projected
+    # table, so they only run when DEBUG logging is enabled.
+    logger.opt(lazy=True).debug("{}", partial(_projection_stats, conn))
 
-    canton_stats = conn.execute("""
-        SELECT COUNT(*), SUM(population), COUNT(DISTINCT canton_code)
-        FROM population_canton
-    """).fetchone()
-    canton_count, canton_pop, n_cantons = canton_stats
-    canton_pct = round(100 * float(canton_pop) / float(dept_pop), 1) if dept_pop else 0
-    logger.debug(
-        "  Canton: {:,} rows, {} cantons ({}% coverage)",
-        canton_count,
-        n_cantons,
-        canton_pct,
-    )
 
-    iris_stats = conn.execute("""
-        SELECT COUNT(*), SUM(population), COUNT(DISTINCT iris_code)
-        FROM population_iris
+def _projection_stats(conn: duckdb.DuckDBPyConnection) -> str:
+    """Summarise the compact projected tables (row counts, coverage)."""
+    dept_count, dept_pop, n_years, n_months, n_depts = conn.execute("""
+        SELECT COUNT(*), SUM(population), COUNT(DISTINCT year),
+               COUNT(DISTINCT month), COUNT(DISTINCT department_code)
+        FROM population_department
     """).fetchone()
-    iris_count, iris_pop, n_irises = iris_stats
-    iris_pct = round(100 * float(iris_pop) / float(dept_pop), 1) if dept_pop else 0
-    logger.debug(
-        "  IRIS: {:,} rows, {} IRIS ({}% coverage)",
-        iris_count,
-        n_irises,
-        iris_pct,
-    )
+    avg_pop = float(dept_pop) / (n_years * n_months) if n_years and n_months else 0
+    lines = [
+        f"  Department: {dept_count:,} rows (x12 at export), "
+        f"{n_years} years, {n_depts} depts, avg {avg_pop:,.0f} pop/month"
+    ]
+
+    epci_count, n_epcis = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT epci_code) FROM population_epci"
+    ).fetchone()
+    lines.append(f"  EPCI: {epci_count:,} rows, {n_epcis} EPCIs")
+
+    for table, geo_col, label, noun in (
+        ("population_canton", "canton_code", "Canton", "cantons"),
+        ("population_iris", "iris_code", "IRIS", "IRIS"),
+    ):
+        count, pop, n_geo = conn.execute(
+            f"SELECT COUNT(*), SUM(population), COUNT(DISTINCT {geo_col}) FROM {table}"
+        ).fetchone()
+        pct = round(100 * float(pop) / float(dept_pop), 1) if dept_pop else 0
+        lines.append(f"  {label}: {count:,} rows, {n_geo} {noun} ({pct}% coverage)")
+    return "\n".join(lines)
 
 
 def _build_band_config_sql() -> str:
@@ -387,10 +404,36 @@ def _build_band_config_sql() -> str:
     return "\n    UNION ALL\n    ".join(rows)
 
 
-def compute_department_mobility_rates(
+def load_mobsco_students(
     conn: duckdb.DuckDBPyConnection,
     mobsco_path: Path,
 ) -> None:
+    """Stage the MOBSCO rows needed by the mobility steps in one parquet scan.
+
+    Creates a `mobsco_students` table restricted to the AGEREV10 groups used
+    by the student bands, with residence/study departments, study commune,
+    sex, and weight already decoded. The mobility-rate and student-flow
+    steps all read from it instead of re-scanning the parquet file.
+
+    Args:
+        conn: DuckDB connection
+        mobsco_path: Path to MOBSCO parquet file
+    """
+    codes = sorted(
+        {*STUDENT_BAND_AGEREV10.values(), *STUDENT_BAND_AGEREV10_SECONDARY.values()}
+        - {None}
+    )
+    conn.execute(
+        sql.CREATE_MOBSCO_STUDENTS.format(
+            agerev10_codes=", ".join(f"'{code}'" for code in codes),
+        ),
+        [str(mobsco_path)],
+    )
+    count = conn.execute("SELECT COUNT(*) FROM mobsco_students").fetchone()[0]
+    logger.debug("  MOBSCO student rows: {:,}", count)
+
+
+def compute_department_mobility_rates(conn: duckdb.DuckDBPyConnection) -> None:
     """Compute per-department, per-age-band student inter-departmental mobility rates.
 
     For each (department, age_band) pair, computes the fraction of students in
@@ -400,60 +443,47 @@ def compute_department_mobility_rates(
     `blend_weight = min(mobility_rate, per-band cap)`, falling back to a
     per-band default for departments not in MOBSCO.
 
-    Requires `commune_epci` table to exist (for dept lookup from commune).
+    Requires the `mobsco_students` table (see :func:`load_mobsco_students`).
 
     Args:
         conn: DuckDB connection
-        mobsco_path: Path to MOBSCO parquet file
     """
     conn.execute(
-        sql.CREATE_MOBILITY_WEIGHTS.format(
-            mobsco_path=mobsco_path,
-            band_config_sql=_build_band_config_sql(),
-        )
+        sql.CREATE_MOBILITY_WEIGHTS.format(band_config_sql=_build_band_config_sql())
     )
     count = conn.execute("SELECT COUNT(*) FROM mobility_weights").fetchone()[0]
     logger.debug("  Mobility weights: {} (dept, band) pairs", count)
 
 
-def apply_student_mobility_correction(
-    conn: duckdb.DuckDBPyConnection,
-    mobsco_path: Path,
-) -> None:
+def apply_student_mobility_correction(conn: duckdb.DuckDBPyConnection) -> None:
     """Blend MOBSCO study-destination ratios into EPCI geo_ratios for student bands.
 
     For age bands 15_19 and 20_24, blends census-based geo_ratios with
-    study-destination ratios from the MOBSCO file, using per-department
+    study-destination ratios from MOBSCO, using per-department
     blend weights from the `mobility_weights` table:
         corrected = (1 - w) * census_ratio + w * study_ratio
     Then renormalizes so ratios sum to 1 per (dept, band, sex).
 
     Other age bands are unchanged.
 
-    Requires `geo_ratios_epci`, `commune_epci`, and `mobility_weights` tables.
+    Requires `geo_ratios_epci`, `commune_epci`, `mobsco_students`, and
+    `mobility_weights` tables.
 
     Args:
         conn: DuckDB connection with geo_ratios_epci table
-        mobsco_path: Path to MOBSCO parquet file
     """
     # 1. Rename existing geo_ratios_epci to _base
     conn.execute(sql.RENAME_GEO_RATIOS_EPCI_TO_BASE)
 
     # 2. Compute student flows from MOBSCO (per age band)
     conn.execute(
-        sql.CREATE_STUDENT_FLOWS_EPCI.format(
-            mobsco_path=mobsco_path,
-            band_config_sql=_build_band_config_sql(),
-        )
+        sql.CREATE_STUDENT_FLOWS_EPCI.format(band_config_sql=_build_band_config_sql())
     )
-    flow_count = conn.execute("SELECT COUNT(*) FROM student_flows_epci").fetchone()[0]
-    flow_depts = conn.execute(
-        "SELECT COUNT(DISTINCT department_code) FROM student_flows_epci"
-    ).fetchone()[0]
-    logger.debug(
-        "  Student flows: {:,} rows across {} departments",
-        flow_count,
-        flow_depts,
+    logger.opt(lazy=True).debug(
+        "  Student flows: {}",
+        partial(
+            _table_summary, conn, "student_flows_epci", "department_code", "departments"
+        ),
     )
 
     # 3. Create corrected geo_ratios_epci (blend + renormalize)
@@ -469,40 +499,30 @@ def apply_student_mobility_correction(
     conn.execute("DROP TABLE IF EXISTS student_flows_epci")
 
 
-def apply_student_mobility_correction_iris(
-    conn: duckdb.DuckDBPyConnection,
-    mobsco_path: Path,
-) -> None:
+def apply_student_mobility_correction_iris(conn: duckdb.DuckDBPyConnection) -> None:
     """Blend MOBSCO study-destination ratios into IRIS geo_ratios for student bands.
 
     Same logic as the EPCI version but at IRIS level. MOBSCO commune-level
     flows are distributed to IRIS using census population proportions.
 
-    Requires `geo_ratios_iris`, `population`, `commune_epci`, and
-    `mobility_weights` tables.
+    Requires `geo_ratios_iris`, `population`, `commune_epci`,
+    `mobsco_students`, and `mobility_weights` tables.
 
     Args:
         conn: DuckDB connection with geo_ratios_iris table
-        mobsco_path: Path to MOBSCO parquet file
     """
     # 1. Rename existing geo_ratios_iris to _base
     conn.execute(sql.RENAME_GEO_RATIOS_IRIS_TO_BASE)
 
     # 2. Compute student flows from MOBSCO at IRIS level (per age band)
     conn.execute(
-        sql.CREATE_STUDENT_FLOWS_IRIS.format(
-            mobsco_path=mobsco_path,
-            band_config_sql=_build_band_config_sql(),
-        )
+        sql.CREATE_STUDENT_FLOWS_IRIS.format(band_config_sql=_build_band_config_sql())
     )
-    flow_count = conn.execute("SELECT COUNT(*) FROM student_flows_iris").fetchone()[0]
-    flow_depts = conn.execute(
-        "SELECT COUNT(DISTINCT department_code) FROM student_flows_iris"
-    ).fetchone()[0]
-    logger.debug(
-        "  IRIS student flows: {:,} rows across {} departments",
-        flow_count,
-        flow_depts,
+    logger.opt(lazy=True).debug(
+        "  IRIS student flows: {}",
+        partial(
+            _table_summary, conn, "student_flows_iris", "department_code", "departments"
+        ),
     )
 
     # 3. Create corrected geo_ratios_iris (blend + renormalize)
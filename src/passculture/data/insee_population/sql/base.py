@@ -1,16 +1,20 @@
 """Base table creation and data registration templates."""
 
 __all__ = [
+    "CANTON_EPCI_WEIGHTS",
     "CREATE_BASE_TABLE",
     "INSERT_MAYOTTE",
     "INSERT_SPM",
     "INSERT_TOM",
+    "LOAD_COG_CANTONS",
     "REGISTER_CANTON_WEIGHTS",
     "REGISTER_COMMUNE_EPCI",
     "REGISTER_INSEE_ESTIMATES",
     "REGISTER_MONTHLY_BIRTHS",
 ]
 
+# Format parameters: {year}, {where_clause}, {iris_sentinel_no_geo}.
+# The INDCVI parquet path is bound as the single `?` parameter.
 CREATE_BASE_TABLE = """
 CREATE OR REPLACE TABLE population AS
 WITH raw_data AS (
@@ -26,7 +30,7 @@ WITH raw_data AS (
             ELSE LEFT(TRIM(IRIS), 5)
         END AS commune_code,
         TRIM(IRIS) AS iris_code
-    FROM read_parquet('{parquet_path}')
+    FROM read_parquet(?)
     {where_clause}
 )
 SELECT
@@ -45,6 +49,39 @@ GROUP BY department_code, region_code, canton_code, commune_code, iris_code, age
 ORDER BY department_code, commune_code, iris_code, age, sex
 """
 
+# Commune -> canton from the COG communes CSV (path bound as `?`); only the
+# two columns needed are parsed, and empty CAN cells load as NULL.
+LOAD_COG_CANTONS = """
+CREATE OR REPLACE TEMP TABLE cog AS
+SELECT COM AS commune_code, CAN AS canton_code
+FROM read_csv(?, header = true, all_varchar = true)
+"""
+
+# Canton -> EPCI weights: each EPCI's share of the canton's commune population.
+# Reads the `cog` table (commune_code, canton_code) and the registered
+# `commune_epci` frame; cantons or EPCIs missing on a commune are left out.
+CANTON_EPCI_WEIGHTS = """
+WITH canton_epci AS (
+    SELECT
+        cog.canton_code,
+        ce.epci_code,
+        SUM(COALESCE(TRY_CAST(ce.commune_population AS DOUBLE), 0)) AS population
+    FROM cog
+    JOIN commune_epci ce ON cog.commune_code = ce.commune_code
+    WHERE cog.canton_code IS NOT NULL AND ce.epci_code IS NOT NULL
+    GROUP BY cog.canton_code, ce.epci_code
+)
+SELECT
+    canton_code,
+    epci_code,
+    COALESCE(
+        population / NULLIF(SUM(population) OVER (PARTITION BY canton_code), 0),
+        0
+    ) AS weight
+FROM canton_epci
+ORDER BY canton_code, epci_code
+"""
+
 REGISTER_COMMUNE_EPCI = (
     "CREATE OR REPLACE TABLE commune_epci AS SELECT * FROM commune_epci_df"
 )
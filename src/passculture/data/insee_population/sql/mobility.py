@@ -10,6 +10,7 @@ __all__ = [
     "CREATE_CORRECTED_GEO_RATIOS_EPCI",
     "CREATE_CORRECTED_GEO_RATIOS_IRIS",
     "CREATE_MOBILITY_WEIGHTS",
+    "CREATE_MOBSCO_STUDENTS",
     "CREATE_STUDENT_FLOWS_EPCI",
     "CREATE_STUDENT_FLOWS_IRIS",
     "RENAME_GEO_RATIOS_EPCI_TO_BASE",
@@ -25,6 +26,30 @@ RENAME_GEO_RATIOS_EPCI_TO_BASE = (
     "ALTER TABLE geo_ratios_epci RENAME TO geo_ratios_epci_base"
 )
 
+# Stage the MOBSCO rows used by the mobility steps in a single parquet scan.
+# Keeps only the AGEREV10 groups referenced by the band config, with columns
+# trimmed and decoded once; the weights and both flow templates read from it.
+# Format parameters: {agerev10_codes} (quoted, comma-separated).
+# The MOBSCO parquet path is bound as the single `?` parameter.
+CREATE_MOBSCO_STUDENTS = """
+CREATE OR REPLACE TABLE mobsco_students AS
+SELECT
+    TRIM(m.AGEREV10) AS agerev10,
+    CASE
+        WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
+        ELSE LEFT(TRIM(m.COMMUNE), 2)
+    END AS residence_dept,
+    TRIM(m.DCETUF) AS study_commune,
+    CASE
+        WHEN LEFT(TRIM(m.DCETUF), 2) = '97' THEN LEFT(TRIM(m.DCETUF), 3)
+        ELSE LEFT(TRIM(m.DCETUF), 2)
+    END AS study_dept,
+    CASE m.SEXE WHEN '1' THEN 'male' WHEN '2' THEN 'female' END AS sex,
+    CAST(m.IPONDI AS DOUBLE) AS weight
+FROM read_parquet(?) m
+WHERE TRIM(m.AGEREV10) IN ({agerev10_codes})
+"""
+
 # Compute per-department, per-age-band inter-departmental student mobility rate.
 #
 # Each age band uses its own MOBSCO AGEREV10 group:
@@ -36,8 +61,8 @@ RENAME_GEO_RATIOS_EPCI_TO_BASE = (
 # blend_weight = min(effective_rate, per-band cap), with per-band fallback default
 # for departments not in MOBSCO.
 #
+# Reads the staged `mobsco_students` table (CREATE_MOBSCO_STUDENTS).
 # Format parameters (supplied by projections.py from constants):
-#   {mobsco_path}       — path to MOBSCO parquet
 #   {band_config_sql}   — VALUES rows: (age_band, agerev10, blend_cap, blend_default,
 #                          secondary_agerev10, secondary_weight)
 CREATE_MOBILITY_WEIGHTS = """
@@ -46,34 +71,14 @@ WITH band_config AS (
     {band_config_sql}
 ),
 mobsco_primary AS (
-    SELECT
-        bc.age_band,
-        CASE
-            WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
-            ELSE LEFT(TRIM(m.COMMUNE), 2)
-        END AS residence_dept,
-        CASE
-            WHEN LEFT(TRIM(m.DCETUF), 2) = '97' THEN LEFT(TRIM(m.DCETUF), 3)
-            ELSE LEFT(TRIM(m.DCETUF), 2)
-        END AS study_dept,
-        CAST(m.IPONDI AS DOUBLE) AS weight
-    FROM read_parquet('{mobsco_path}') m
-    JOIN band_config bc ON TRIM(m.AGEREV10) = bc.agerev10
+    SELECT bc.age_band, m.residence_dept, m.study_dept, m.weight
+    FROM mobsco_students m
+    JOIN band_config bc ON m.agerev10 = bc.agerev10
 ),
 mobsco_secondary AS (
-    SELECT
-        bc.age_band,
-        CASE
-            WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
-            ELSE LEFT(TRIM(m.COMMUNE), 2)
-        END AS residence_dept,
-        CASE
-            WHEN LEFT(TRIM(m.DCETUF), 2) = '97' THEN LEFT(TRIM(m.DCETUF), 3)
-            ELSE LEFT(TRIM(m.DCETUF), 2)
-        END AS study_dept,
-        CAST(m.IPONDI AS DOUBLE) AS weight
-    FROM read_parquet('{mobsco_path}') m
-    JOIN band_config bc ON TRIM(m.AGEREV10) = bc.secondary_agerev10
+    SELECT bc.age_band, m.residence_dept, m.study_dept, m.weight
+    FROM mobsco_students m
+    JOIN band_config bc ON m.agerev10 = bc.secondary_agerev10
     WHERE bc.secondary_agerev10 IS NOT NULL AND bc.secondary_weight > 0
 ),
 primary_rates AS (
@@ -135,14 +140,14 @@ LEFT JOIN rates r
 WHERE r.department_code IS NULL
 """
 
-# Compute study-destination EPCI distribution from MOBSCO parquet, per age band.
+# Compute study-destination EPCI distribution from MOBSCO, per age band.
 # For bands with a secondary AGEREV10 (e.g. 15_19 has higher-ed secondary),
 # the study_geo_ratio is a weighted mix of primary and secondary flow distributions:
 #   study_geo_ratio = (1 - secondary_weight) * primary_ratio
 #                   + secondary_weight * secondary_ratio
 # This correctly models that ~25% of 15_19 (ages 18-19 in higher-ed) follow
 # higher-ed destination patterns rather than lycée destination patterns.
-# Format parameters: {mobsco_path}, {band_config_sql}
+# Reads `mobsco_students`. Format parameters: {band_config_sql}
 CREATE_STUDENT_FLOWS_EPCI = """
 CREATE OR REPLACE TABLE student_flows_epci AS
 WITH band_config AS (
@@ -150,31 +155,17 @@ WITH band_config AS (
 ),
 -- Primary raw flows: column transforms only, no aggregation yet
 mobsco_primary AS (
-    SELECT
-        bc.age_band,
-        CASE
-            WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
-            ELSE LEFT(TRIM(m.COMMUNE), 2)
-        END AS department_code,
-        TRIM(m.DCETUF) AS study_commune,
-        CASE m.SEXE WHEN '1' THEN 'male' WHEN '2' THEN 'female' END AS sex,
-        CAST(m.IPONDI AS DOUBLE) AS weight
-    FROM read_parquet('{mobsco_path}') m
-    JOIN band_config bc ON TRIM(m.AGEREV10) = bc.agerev10
+    SELECT bc.age_band, m.residence_dept AS department_code, m.study_commune,
+           m.sex, m.weight
+    FROM mobsco_students m
+    JOIN band_config bc ON m.agerev10 = bc.agerev10
 ),
 -- Secondary raw flows (higher-ed for 15_19; empty for 20_24)
 mobsco_secondary AS (
-    SELECT
-        bc.age_band,
-        CASE
-            WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
-            ELSE LEFT(TRIM(m.COMMUNE), 2)
-        END AS department_code,
-        TRIM(m.DCETUF) AS study_commune,
-        CASE m.SEXE WHEN '1' THEN 'male' WHEN '2' THEN 'female' END AS sex,
-        CAST(m.IPONDI AS DOUBLE) AS weight
-    FROM read_parquet('{mobsco_path}') m
-    JOIN band_config bc ON TRIM(m.AGEREV10) = bc.secondary_agerev10
+    SELECT bc.age_band, m.residence_dept AS department_code, m.study_commune,
+           m.sex, m.weight
+    FROM mobsco_students m
+    JOIN band_config bc ON m.agerev10 = bc.secondary_agerev10
     WHERE bc.secondary_agerev10 IS NOT NULL AND bc.secondary_weight > 0
 ),
 -- EPCI aggregation for primary flows
@@ -337,12 +328,12 @@ RENAME_GEO_RATIOS_IRIS_TO_BASE = (
     "ALTER TABLE geo_ratios_iris RENAME TO geo_ratios_iris_base"
 )
 
-# Compute study-destination IRIS distribution from MOBSCO parquet, per age band.
+# Compute study-destination IRIS distribution from MOBSCO, per age band.
 # Distributes commune-level MOBSCO flows to IRIS using census population
 # proportions within each study commune.
 # For bands with a secondary AGEREV10 (15_19), mixes primary + secondary flows
 # exactly as in CREATE_STUDENT_FLOWS_EPCI.
-# Format parameters: {mobsco_path}, {band_config_sql}
+# Reads `mobsco_students`. Format parameters: {band_config_sql}
 CREATE_STUDENT_FLOWS_IRIS = f"""
 CREATE OR REPLACE TABLE student_flows_iris AS
 WITH band_config AS (
@@ -360,38 +351,24 @@ iris_commune_share AS (
     FROM population p
     LEFT JOIN commune_epci ce ON p.commune_code = ce.commune_code
     WHERE p.iris_code <> '{IRIS_SENTINEL_NO_GEO}'
-      AND RIGHT(p.iris_code, 4) <> '{IRIS_SENTINEL_MASKED_SUFFIX}'
+      AND NOT ends_with(p.iris_code, '{IRIS_SENTINEL_MASKED_SUFFIX}')
       AND LENGTH(p.iris_code) = 9
     GROUP BY p.commune_code, p.department_code, p.region_code,
              p.iris_code, ce.epci_code
 ),
 -- Primary raw flows: column transforms only
 mobsco_iris_primary AS (
-    SELECT
-        bc.age_band,
-        CASE
-            WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
-            ELSE LEFT(TRIM(m.COMMUNE), 2)
-        END AS department_code,
-        TRIM(m.DCETUF) AS study_commune,
-        CASE m.SEXE WHEN '1' THEN 'male' WHEN '2' THEN 'female' END AS sex,
-        CAST(m.IPONDI AS DOUBLE) AS weight
-    FROM read_parquet('{{mobsco_path}}') m
-    JOIN band_config bc ON TRIM(m.AGEREV10) = bc.agerev10
+    SELECT bc.age_band, m.residence_dept AS department_code, m.study_commune,
+           m.sex, m.weight
+    FROM mobsco_students m
+    JOIN band_config bc ON m.agerev10 = bc.agerev10
 ),
 -- Secondary raw flows (higher-ed for 15_19; empty for 20_24)
 mobsco_iris_secondary AS (
-    SELECT
-        bc.age_band,
-        CASE
-            WHEN LEFT(TRIM(m.COMMUNE), 2) = '97' THEN LEFT(TRIM(m.COMMUNE), 3)
-            ELSE LEFT(TRIM(m.COMMUNE), 2)
-        END AS department_code,
-        TRIM(m.DCETUF) AS study_commune,
-        CASE m.SEXE WHEN '1' THEN 'male' WHEN '2' THEN 'female' END AS sex,
-        CAST(m.IPONDI AS DOUBLE) AS weight
-    FROM read_parquet('{{mobsco_path}}') m
-    JOIN band_config bc ON TRIM(m.AGEREV10) = bc.secondary_agerev10
+    SELECT bc.age_band, m.residence_dept AS department_code, m.study_commune,
+           m.sex, m.weight
+    FROM mobsco_students m
+    JOIN band_config bc ON m.agerev10 = bc.secondary_agerev10
     WHERE bc.secondary_agerev10 IS NOT NULL AND bc.secondary_weight > 0
 ),
 -- IRIS aggregation for primary flows
@@ -95,19 +95,32 @@ LEFT JOIN factors fac
 # control monthly vs yearly mode.
 CREATE_PROJECTED_DEPARTMENT = """
 CREATE OR REPLACE TABLE population_department AS
-WITH census_dept AS (
+WITH dept_regions AS (
+    -- One region per department, resolved once rather than per census group
+    SELECT department_code, ANY_VALUE(region_code) AS region_code
+    FROM population
+    GROUP BY department_code
+),
+census_dept AS (
     SELECT
-        department_code,
-        (SELECT DISTINCT region_code FROM population p2
-         WHERE p2.department_code = p.department_code LIMIT 1) AS region_code,
-        age,
-        sex,
-        SUM(population) AS population
+        p.department_code,
+        dr.region_code,
+        p.age,
+        p.sex,
+        SUM(p.population) AS population
     FROM population p
-    GROUP BY department_code, age, sex
+    JOIN dept_regions dr ON p.department_code = dr.department_code
+    GROUP BY p.department_code, dr.region_code, p.age, p.sex
 ),
 projection_years AS (
-    SELECT generate_series AS year
+    -- The error margin depends only on the year, so resolve it once per year
+    SELECT
+        generate_series AS year,
+        CASE
+            WHEN ABS(generate_series - {census_year}) <= 1 THEN {ci_base_near}
+            WHEN ABS(generate_series - {census_year}) <= 3 THEN {ci_base_mid}
+            ELSE {ci_per_year} * ABS(generate_series - {census_year})
+        END AS confidence_pct
     FROM generate_series({start_year}, {end_year})
 ),
 projected AS (
@@ -118,7 +131,8 @@ projected AS (
         c.region_code,
         (c.age + (py.year - {census_year})) AS age,
         c.sex,
-        CAST(c.population AS DOUBLE){month_factor} AS population
+        CAST(c.population AS DOUBLE){month_factor} AS population,
+        py.confidence_pct
     FROM census_dept c
     CROSS JOIN projection_years py
     {month_join}
@@ -137,21 +151,9 @@ SELECT
     sex,
     'exact' AS geo_precision,
     population,
-    CASE
-        WHEN ABS(year - {census_year}) <= 1 THEN {ci_base_near}
-        WHEN ABS(year - {census_year}) <= 3 THEN {ci_base_mid}
-        ELSE {ci_per_year} * ABS(year - {census_year})
-    END AS confidence_pct,
-    population * (1.0 - CASE
-        WHEN ABS(year - {census_year}) <= 1 THEN {ci_base_near}
-        WHEN ABS(year - {census_year}) <= 3 THEN {ci_base_mid}
-        ELSE {ci_per_year} * ABS(year - {census_year})
-    END) AS population_low,
-    population * (1.0 + CASE
-        WHEN ABS(year - {census_year}) <= 1 THEN {ci_base_near}
-        WHEN ABS(year - {census_year}) <= 3 THEN {ci_base_mid}
-        ELSE {ci_per_year} * ABS(year - {census_year})
-    END) AS population_high
+    confidence_pct,
+    population * (1.0 - confidence_pct) AS population_low,
+    population * (1.0 + confidence_pct) AS population_high
 FROM projected
 WHERE population > 0
 """
@@ -167,16 +169,22 @@ WHERE population > 0
 # cohort-aging template so monthly vs yearly mode works identically.
 CREATE_PROJECTED_DEPARTMENT_COHORT_STABLE = """
 CREATE OR REPLACE TABLE population_department AS
-WITH census_dept AS (
+WITH dept_regions AS (
+    -- One region per department, resolved once rather than per census group
+    SELECT department_code, ANY_VALUE(region_code) AS region_code
+    FROM population
+    GROUP BY department_code
+),
+census_dept AS (
     SELECT
-        department_code,
-        (SELECT DISTINCT region_code FROM population p2
-         WHERE p2.department_code = p.department_code LIMIT 1) AS region_code,
-        age,
-        sex,
-        SUM(population) AS population
+        p.department_code,
+        dr.region_code,
+        p.age,
+        p.sex,
+        SUM(p.population) AS population
     FROM population p
-    GROUP BY department_code, age, sex
+    JOIN dept_regions dr ON p.department_code = dr.department_code
+    GROUP BY p.department_code, dr.region_code, p.age, p.sex
 ),
 cohort_totals AS (
     SELECT age, sex, SUM(population) AS total_effectif
@@ -195,7 +203,14 @@ dept_age_sex_shares AS (
         ON cd.age = ct.age AND cd.sex = ct.sex
 ),
 projection_years AS (
-    SELECT generate_series AS year
+    -- The error margin depends only on the year, so resolve it once per year
+    SELECT
+        generate_series AS year,
+        CASE
+            WHEN ABS(generate_series - {census_year}) <= 1 THEN {ci_base_near}
+            WHEN ABS(generate_series - {census_year}) <= 3 THEN {ci_base_mid}
+            ELSE {ci_per_year} * ABS(generate_series - {census_year})
+        END AS confidence_pct
     FROM generate_series({start_year}, {end_year})
 ),
 projected AS (
@@ -206,7 +221,8 @@ projected AS (
         ds.region_code,
         ds.age AS age,
         ds.sex,
-        CAST(ct.total_effectif AS DOUBLE){month_factor} * ds.dept_share AS population
+        CAST(ct.total_effectif AS DOUBLE){month_factor} * ds.dept_share AS population,
+        py.confidence_pct
     FROM projection_years py
     CROSS JOIN dept_age_sex_shares ds
     JOIN cohort_totals ct
@@ -228,36 +244,22 @@ SELECT
     sex,
     'exact' AS geo_precision,
     population,
-    CASE
-        WHEN ABS(year - {census_year}) <= 1 THEN {ci_base_near}
-        WHEN ABS(year - {census_year}) <= 3 THEN {ci_base_mid}
-        ELSE {ci_per_year} * ABS(year - {census_year})
-    END AS confidence_pct,
-    population * (1.0 - CASE
-        WHEN ABS(year - {census_year}) <= 1 THEN {ci_base_near}
-        WHEN ABS(year - {census_year}) <= 3 THEN {ci_base_mid}
-        ELSE {ci_per_year} * ABS(year - {census_year})
-    END) AS population_low,
-    population * (1.0 + CASE
-        WHEN ABS(year - {census_year}) <= 1 THEN {ci_base_near}
-        WHEN ABS(year - {census_year}) <= 3 THEN {ci_base_mid}
-        ELSE {ci_per_year} * ABS(year - {census_year})
-    END) AS population_high
+    confidence_pct,
+    population * (1.0 - confidence_pct) AS population_low,
+    population * (1.0 + confidence_pct) AS population_high
 FROM projected
 WHERE population > 0
 """
 
 # Template for geo-level population projection: department projection * geo_ratio.
 # Parameterized by level name, geo columns, and CI extra placeholder.
-# Uses {{ }} for runtime placeholders (age_band_cases, ci_extra_{level}).
+# Uses {{ }} for runtime placeholders (age_band_expr, ci_extra_{level}).
 _PROJECTED_GEO_TEMPLATE = """
 CREATE OR REPLACE TABLE population_{level} AS
 WITH age_band_map AS (
     SELECT
         age,
-        CASE
-            {{age_band_cases}}
-        END AS age_band
+        {{age_band_expr}} AS age_band
     FROM generate_series(0, {{max_age}}) AS t(age)
 )
 SELECT
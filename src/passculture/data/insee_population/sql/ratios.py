@@ -1,35 +1,44 @@
 """Geographic ratio computation templates."""
 
 __all__ = [
+    "CREATE_BANDED_POPULATION",
     "CREATE_GEO_RATIOS_CANTON",
     "CREATE_GEO_RATIOS_EPCI",
     "CREATE_GEO_RATIOS_IRIS",
 ]
 
-# Compute EPCI share within each dept/age_band/sex from INDCVI population
+# Collapse single-year ages into age bands once; the three geo-ratio tables
+# below all aggregate this instead of re-joining the full `population` table.
+CREATE_BANDED_POPULATION = """
+CREATE OR REPLACE TEMP TABLE population_banded AS
+SELECT
+    department_code,
+    region_code,
+    commune_code,
+    iris_code,
+    canton_code,
+    {age_band_expr} AS age_band,
+    sex,
+    SUM(population) AS population
+FROM population
+WHERE age BETWEEN 0 AND {max_age}
+GROUP BY ALL
+"""
+
+# Compute EPCI share within each dept/age_band/sex from banded INDCVI population
 CREATE_GEO_RATIOS_EPCI = """
 CREATE OR REPLACE TABLE geo_ratios_epci AS
-WITH age_band_map AS (
-    SELECT
-        age,
-        CASE
-            {age_band_cases}
-        END AS age_band
-    FROM generate_series(0, {max_age}) AS t(age)
-),
-epci_pop AS (
+WITH epci_pop AS (
     SELECT
         p.department_code,
         ce.epci_code,
-        abm.age_band,
+        p.age_band,
         p.sex,
         SUM(p.population) AS epci_population
-    FROM population p
+    FROM population_banded p
     INNER JOIN commune_epci ce ON p.commune_code = ce.commune_code
-    JOIN age_band_map abm ON p.age = abm.age
     WHERE p.commune_code <> '' AND p.iris_code <> '{iris_sentinel_no_geo}'
-      AND abm.age_band IS NOT NULL
-    GROUP BY p.department_code, ce.epci_code, abm.age_band, p.sex
+    GROUP BY p.department_code, ce.epci_code, p.age_band, p.sex
 ),
 dept_totals AS (
     SELECT
@@ -44,7 +53,7 @@ dept_totals AS (
 -- EPCI entry using the department code, with geo_ratio=1.0.
 fallback_depts AS (
     SELECT DISTINCT department_code
-    FROM population
+    FROM population_banded
     WHERE department_code NOT IN (SELECT DISTINCT department_code FROM epci_pop)
       AND iris_code = '{iris_sentinel_no_geo}'
 ),
@@ -52,14 +61,12 @@ synthetic_epci AS (
     SELECT
         p.department_code,
         p.department_code AS epci_code,
-        abm.age_band,
+        p.age_band,
         p.sex,
         1.0 AS geo_ratio
-    FROM population p
-    JOIN age_band_map abm ON p.age = abm.age
+    FROM population_banded p
     JOIN fallback_depts fd ON p.department_code = fd.department_code
-    WHERE abm.age_band IS NOT NULL
-    GROUP BY p.department_code, abm.age_band, p.sex
+    GROUP BY p.department_code, p.age_band, p.sex
 )
 SELECT
     ep.department_code,
@@ -79,36 +86,26 @@ UNION ALL
 SELECT * FROM synthetic_epci
 """
 
-# Compute IRIS share within each dept/age_band/sex from INDCVI population
+# Compute IRIS share within each dept/age_band/sex from banded INDCVI population
 CREATE_GEO_RATIOS_IRIS = """
 CREATE OR REPLACE TABLE geo_ratios_iris AS
-WITH age_band_map AS (
-    SELECT
-        age,
-        CASE
-            {age_band_cases}
-        END AS age_band
-    FROM generate_series(0, {max_age}) AS t(age)
-),
-iris_pop AS (
+WITH iris_pop AS (
     SELECT
         p.department_code,
         p.region_code,
         p.commune_code,
         p.iris_code,
         ce.epci_code,
-        abm.age_band,
+        p.age_band,
         p.sex,
         SUM(p.population) AS iris_population
-    FROM population p
+    FROM population_banded p
     LEFT JOIN commune_epci ce ON p.commune_code = ce.commune_code
-    JOIN age_band_map abm ON p.age = abm.age
     WHERE p.iris_code <> '{iris_sentinel_no_geo}'
-      AND RIGHT(p.iris_code, 4) <> '{iris_sentinel_masked_suffix}'
+      AND NOT ends_with(p.iris_code, '{iris_sentinel_masked_suffix}')
       AND LENGTH(p.iris_code) = 9
-      AND abm.age_band IS NOT NULL
     GROUP BY p.department_code, p.region_code, p.commune_code,
-             p.iris_code, ce.epci_code, abm.age_band, p.sex
+             p.iris_code, ce.epci_code, p.age_band, p.sex
 ),
 dept_totals AS (
     SELECT
@@ -123,7 +120,7 @@ dept_totals AS (
 -- iris_code already assigned to them, with geo_ratio=1.0.
 fallback_depts AS (
     SELECT DISTINCT department_code
-    FROM population
+    FROM population_banded
     WHERE department_code NOT IN (SELECT DISTINCT department_code FROM iris_pop)
       AND iris_code = '{iris_sentinel_no_geo}'
 ),
@@ -134,15 +131,13 @@ synthetic_iris AS (
         p.commune_code,
         p.iris_code,
         NULL AS epci_code,
-        abm.age_band,
+        p.age_band,
         p.sex,
         1.0 AS geo_ratio
-    FROM population p
-    JOIN age_band_map abm ON p.age = abm.age
+    FROM population_banded p
     JOIN fallback_depts fd ON p.department_code = fd.department_code
-    WHERE abm.age_band IS NOT NULL
     GROUP BY p.department_code, p.region_code, p.commune_code, p.iris_code,
-             abm.age_band, p.sex
+             p.age_band, p.sex
 )
 SELECT
     ip.department_code,
@@ -165,32 +160,22 @@ UNION ALL
 SELECT * FROM synthetic_iris
 """
 
-# Compute canton share within each dept/age_band/sex from INDCVI population
+# Compute canton share within each dept/age_band/sex from banded INDCVI population
 CREATE_GEO_RATIOS_CANTON = """
 CREATE OR REPLACE TABLE geo_ratios_canton AS
-WITH age_band_map AS (
-    SELECT
-        age,
-        CASE
-            {age_band_cases}
-        END AS age_band
-    FROM generate_series(0, {max_age}) AS t(age)
-),
-canton_pop AS (
+WITH canton_pop AS (
     SELECT
         p.department_code,
         p.region_code,
         p.canton_code,
-        abm.age_band,
+        p.age_band,
         p.sex,
         SUM(p.population) AS canton_population
-    FROM population p
-    JOIN age_band_map abm ON p.age = abm.age
+    FROM population_banded p
     WHERE p.canton_code IS NOT NULL
       AND p.canton_code <> ''
-      AND abm.age_band IS NOT NULL
     GROUP BY p.department_code, p.region_code, p.canton_code,
-             abm.age_band, p.sex
+             p.age_band, p.sex
 ),
 dept_totals AS (
     SELECT
@@ -1,8 +1,6 @@
 """Output queries, statistics, and validation templates."""
 
 __all__ = [
-    "COUNT_INVALID_POPULATION",
-    "GET_DISTINCT_DEPARTMENTS",
     "GET_ROW_COUNT",
     "GET_VALIDATION_STATS",
     "SELECT_WITH_BIRTH_MONTH",
@@ -37,6 +35,8 @@ WHERE pd.population * bb.month_ratio > 0
 
 GET_ROW_COUNT = "SELECT COUNT(*) FROM population"
 
+# One scan for validate(): the summary stats plus the invalid-row count and
+# the department list used for the coverage checks.
 GET_VALIDATION_STATS = """
 SELECT
     COUNT(*) AS total_rows,
@@ -44,12 +44,8 @@ SELECT
     COUNT(DISTINCT department_code) AS departments,
     COUNT(DISTINCT year) AS years,
     MIN(age) AS min_age,
-    MAX(age) AS max_age
+    MAX(age) AS max_age,
+    COUNT(*) FILTER (WHERE population IS NULL OR population < 0) AS invalid_rows,
+    LIST(DISTINCT department_code) AS department_codes
 FROM population
 """
-
-COUNT_INVALID_POPULATION = """
-SELECT COUNT(*) FROM population WHERE population IS NULL OR population < 0
-"""
-
-GET_DISTINCT_DEPARTMENTS = "SELECT DISTINCT department_code FROM population"
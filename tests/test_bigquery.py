@@ -168,6 +168,13 @@ class TestSchemaStructure:
         """POPULATION_SCHEMAS has exactly department, epci, canton, iris."""
         assert set(POPULATION_SCHEMAS) == {"department", "epci", "canton", "iris"}
 
+    def test_schema_fields_are_read_only(self):
+        """Shared field entries cannot be mutated through any level's schema."""
+        field = POPULATION_SCHEMA_EPCI[0]
+        assert field is POPULATION_SCHEMA_IRIS[0]
+        with pytest.raises(TypeError):
+            field["type"] = "STRING"
+
     def test_all_schemas_have_common_columns(self):
         """All schemas contain the common columns."""
         common_names = {
@@ -278,6 +285,40 @@ class TestExportToBigQuery:
             is mock_bq.LoadJobConfig.call_args.kwargs["source_format"]
         )
 
+    @patch("passculture.data.insee_population.bigquery.bigquery")
+    def test_clusters_on_level_geo_columns(self, mock_bq, projection_processor):
+        """Each level is clustered on existing columns, department first."""
+        from google.api_core.exceptions import NotFound
+
+        mock_client = MagicMock()
+        mock_bq.Client.return_value = mock_client
+        mock_client.get_table.side_effect = NotFound("missing")
+        mock_client.load_table_from_file.return_value = MagicMock(output_rows=1)
+
+        from passculture.data.insee_population.bigquery import export_to_bigquery
+
+        for level, schema in POPULATION_SCHEMAS.items():
+            export_to_bigquery(projection_processor, level, "p", "d", f"pop_{level}")
+            fields = mock_bq.LoadJobConfig.call_args.kwargs["clustering_fields"]
+            assert fields[0] == "department_code"
+            assert len(fields) <= 4
+            assert set(fields) <= {c["name"] for c in schema}
+
+    @patch("passculture.data.insee_population.bigquery.bigquery")
+    def test_existing_table_keeps_its_clustering(self, mock_bq, projection_processor):
+        """Loading into an existing table does not request a clustering spec."""
+        mock_client = MagicMock()
+        mock_bq.Client.return_value = mock_client
+        mock_client.get_table.return_value = MagicMock(clustering_fields=None)
+        mock_client.load_table_from_file.return_value = MagicMock(output_rows=1)
+
+        from passculture.data.insee_population.bigquery import export_to_bigquery
+
+        export_to_bigquery(projection_processor, "epci", "p", "d", "pop_epci")
+
+        mock_client.get_table.assert_called_once_with("p.d.pop_epci")
+        assert mock_bq.LoadJobConfig.call_args.kwargs["clustering_fields"] is None
+
     @patch("passculture.data.insee_population.bigquery.bigquery")
     def test_rejects_unknown_level(self, mock_bq, projection_processor):
         """export_to_bigquery raises ValueError for unknown level."""
@@ -361,6 +402,74 @@ class TestYearlyDownsample:
         ).fetchall()
         assert [m[0] for m in months] == list(range(1, 13))
 
+    def test_copy_path_is_bound_not_interpolated(
+        self, monthly_projection_processor, tmp_path
+    ):
+        """Destination paths containing quotes are written verbatim."""
+        import pandas as pd
+
+        out_dir = tmp_path / "l'export"
+        out_dir.mkdir()
+        path = monthly_projection_processor.copy_level_to_parquet(
+            "department", out_dir / "dept.parquet"
+        )
+        assert len(pd.read_parquet(path)) > 0
+
+    def test_save_multi_level_parallel_matches_sequential(
+        self, monthly_projection_processor, tmp_path
+    ):
+        """Writing levels on worker cursors yields the same rows as sequentially."""
+        import pandas as pd
+
+        seq = monthly_projection_processor.save_multi_level(tmp_path / "seq")
+        par = monthly_projection_processor.save_multi_level(
+            tmp_path / "par", max_workers=4
+        )
+        assert list(par) == ["department", "epci", "canton", "iris"]
+        for level, path in par.items():
+            keys = list(pd.read_parquet(path).columns)
+            expected = pd.read_parquet(seq[level]).sort_values(keys)
+            actual = pd.read_parquet(path).sort_values(keys)
+            pd.testing.assert_frame_equal(
+                expected.reset_index(drop=True), actual.reset_index(drop=True)
+            )
+
+    def test_save_multi_level_partitioned(self, monthly_projection_processor, tmp_path):
+        """partition_by writes one hive directory per level, same row count."""
+        import duckdb
+
+        flat = monthly_projection_processor.save_multi_level(tmp_path / "flat")
+        parts = monthly_projection_processor.save_multi_level(
+            tmp_path / "parts", partition_by=("year",)
+        )
+        for level, path in parts.items():
+            assert path.is_dir()
+            assert any(p.name.startswith("year=") for p in path.iterdir())
+            count = duckdb.sql(
+                f"SELECT COUNT(*) FROM read_parquet('{path}/**/*.parquet', "
+                "hive_partitioning = true)"
+            ).fetchone()[0]
+            expected = duckdb.sql(f"SELECT COUNT(*) FROM '{flat[level]}'").fetchone()[0]
+            assert count == expected
+
+    def test_save_multi_level_partitioned_replaces_previous_run(
+        self, monthly_projection_processor, tmp_path
+    ):
+        """Re-exporting a partitioned level leaves no stale partition files."""
+        stale = tmp_path / "population_department" / "year=1999" / "data_0.parquet"
+        stale.parent.mkdir(parents=True)
+        stale.write_bytes(b"stale")
+
+        paths = monthly_projection_processor.save_multi_level(
+            tmp_path, partition_by=("year",)
+        )
+        monthly_projection_processor.save_multi_level(tmp_path, partition_by=("year",))
+
+        assert not stale.parent.exists()
+        files = sorted(paths["department"].rglob("*.parquet"))
+        assert files
+        assert all(f.parent.name != "year=1999" for f in files)
+
     def test_yearly_keeps_only_january_snapshot(
         self, monthly_projection_processor, tmp_path
     ):
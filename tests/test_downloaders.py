@@ -28,6 +28,17 @@ class _FakeResponse:
         if content_length is not None:
             self.headers["content-length"] = str(content_length)
 
+        self.closed = False
+
+    def __enter__(self) -> _FakeResponse:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.closed = True
+
     def raise_for_status(self) -> None:
         pass
 
@@ -36,7 +47,7 @@ class _FakeResponse:
 
 
 def _patch_get(monkeypatch, *responses) -> None:
-    """Patch requests.get to return/raise the given responses in sequence.
+    """Patch the HTTP session's get to return/raise the given responses in order.
 
     A response that is an Exception instance is raised; the last response is
     reused for any further calls.
@@ -49,7 +60,7 @@ def _patch_get(monkeypatch, *responses) -> None:
             raise item
         return item
 
-    monkeypatch.setattr(downloaders.requests, "get", fake_get)
+    monkeypatch.setattr(downloaders._HTTP, "get", fake_get)
 
 
 def test_is_valid_parquet(tmp_path: Path):
@@ -70,7 +81,7 @@ def test_download_file_writes_complete_file(monkeypatch, tmp_path: Path):
     _patch_get(monkeypatch, _FakeResponse([PARQUET[:8], PARQUET[8:]]))
 
     dest = tmp_path / "indcvi.parquet"
-    downloaders._download_file("http://x", dest, validate=downloaders._is_valid_parquet)
+    downloaders.download_file("http://x", dest, validate=downloaders._is_valid_parquet)
 
     assert dest.read_bytes() == PARQUET
     assert not dest.with_suffix(".parquet.part").exists()
@@ -82,7 +93,7 @@ def test_download_file_truncated_fails_and_leaves_no_file(monkeypatch, tmp_path:
 
     dest = tmp_path / "indcvi.parquet"
     with pytest.raises(OSError, match=r"after .* attempts"):
-        downloaders._download_file("http://x", dest, retries=2)
+        downloaders.download_file("http://x", dest, retries=2)
 
     assert not dest.exists()
     assert not dest.with_suffix(".parquet.part").exists()
@@ -94,7 +105,7 @@ def test_download_file_invalid_magic_fails(monkeypatch, tmp_path: Path):
 
     dest = tmp_path / "indcvi.parquet"
     with pytest.raises(OSError, match=r"after .* attempts"):
-        downloaders._download_file(
+        downloaders.download_file(
             "http://x", dest, validate=downloaders._is_valid_parquet, retries=2
         )
 
@@ -102,6 +113,20 @@ def test_download_file_invalid_magic_fails(monkeypatch, tmp_path: Path):
     assert not dest.with_suffix(".parquet.part").exists()
 
 
+def test_download_file_closes_response_on_error(monkeypatch, tmp_path: Path):
+    response = _FakeResponse([b"partial"])
+
+    def fail():
+        raise requests.HTTPError("503")
+
+    response.raise_for_status = fail
+    _patch_get(monkeypatch, response)
+
+    with pytest.raises(OSError, match=r"after .* attempts"):
+        downloaders.download_file("http://x", tmp_path / "x.parquet", retries=1)
+    assert response.closed
+
+
 def test_download_file_retries_then_succeeds(monkeypatch, tmp_path: Path):
     # First attempt drops the connection; second delivers a valid parquet.
     _patch_get(
@@ -111,7 +136,7 @@ def test_download_file_retries_then_succeeds(monkeypatch, tmp_path: Path):
     )
 
     dest = tmp_path / "indcvi.parquet"
-    downloaders._download_file(
+    downloaders.download_file(
         "http://x", dest, validate=downloaders._is_valid_parquet, retries=3
     )
 
@@ -132,13 +157,136 @@ def test_cached_parquet_discards_corrupt_cache(monkeypatch, tmp_path: Path):
     assert corrupt.read_bytes() == PARQUET
 
 
+def test_cached_parquet_without_cache_dir_downloads_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(downloaders, "_session_tmp", tmp_path)
+    calls = []
+
+    def fake_get(*_a, **_k):
+        calls.append(1)
+        return _FakeResponse([PARQUET])
+
+    monkeypatch.setattr(downloaders._HTTP, "get", fake_get)
+
+    first = downloaders._cached_parquet("http://x", "mobsco_test.parquet", None)
+    second = downloaders._cached_parquet("http://x", "mobsco_test.parquet", None)
+
+    assert first == second
+    assert first.parent == tmp_path
+    assert len(calls) == 1
+
+
+def test_url_cache_name_follows_source_url():
+    a = downloaders._url_cache_name("insee_estimates_pop3", "http://x/1/pop3.xlsx")
+    b = downloaders._url_cache_name("insee_estimates_pop3", "http://x/2/pop3.xlsx")
+    assert a.startswith("insee_estimates_pop3_") and a.endswith(".parquet")
+    assert a != b
+    assert a == downloaders._url_cache_name(
+        "insee_estimates_pop3", "http://x/1/pop3.xlsx"
+    )
+
+
+def test_read_cached_frame_returns_copies_and_sees_rewrites(tmp_path: Path):
+    import os
+
+    import pandas as pd
+
+    path = tmp_path / "wlf_census_2023.parquet"
+    pd.DataFrame({"age": [15], "population": [1.0]}).to_parquet(path)
+
+    first = downloaders.read_cached_frame(path)
+    first.loc[0, "population"] = 99.0
+    assert downloaders.read_cached_frame(path).population.iloc[0] == 1.0
+
+    pd.DataFrame({"age": [15], "population": [2.0]}).to_parquet(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert downloaders.read_cached_frame(path).population.iloc[0] == 2.0
+
+
+@pytest.mark.parametrize(
+    ("cell", "expected"),
+    [
+        (12.5, 12.5),
+        ("1 234,5", 1234.5),
+        ("1\u00a0234", 1234.0),
+        ("12\u202f345,25", 12345.25),
+        ("n/a", 0.0),
+        (None, 0.0),
+    ],
+)
+def test_safe_float_parses_french_numbers(cell, expected):
+    assert downloaders._safe_float(cell) == expected
+
+
+def test_fetch_concurrently_downloads_all_and_releases_progress(
+    monkeypatch, tmp_path: Path
+):
+    bodies = {"http://a": PARQUET, "http://b": PARQUET}
+    monkeypatch.setattr(
+        downloaders._HTTP, "get", lambda url, **_k: _FakeResponse([bodies[url]])
+    )
+
+    def job(url: str, name: str):
+        return lambda: downloaders._cached_parquet(url, name, tmp_path)
+
+    paths = downloaders.fetch_concurrently(
+        {"a": job("http://a", "a.parquet"), "b": job("http://b", "b.parquet")}
+    )
+
+    assert list(paths) == ["a", "b"]
+    assert all(p.read_bytes() == PARQUET for p in paths.values())
+    assert downloaders._progress is None
+
+
+def test_fetch_concurrently_propagates_job_errors():
+    def boom():
+        raise OSError("no network")
+
+    with pytest.raises(OSError, match="no network"):
+        downloaders.fetch_concurrently({"ok": lambda: 1, "bad": boom})
+
+
+def test_zip_member_extracted_from_spooled_download(monkeypatch):
+    import io
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("sub/POP1B.xls", b"sheet-bytes")
+    payload = buf.getvalue()
+    _patch_get(monkeypatch, _FakeResponse([payload[:10], payload[10:]]))
+
+    with downloaders._fetch_to_spool("http://x") as archive:
+        assert downloaders._extract_zip_member(archive, "POP1B.xls") == b"sheet-bytes"
+
+
+def test_spooled_download_closes_response_on_error(monkeypatch):
+    import requests
+
+    response = _FakeResponse([b"partial"])
+
+    def fail():
+        raise requests.HTTPError("503")
+
+    response.raise_for_status = fail
+    _patch_get(monkeypatch, response)
+
+    with pytest.raises(requests.HTTPError), downloaders._fetch_to_spool("http://x"):
+        pass
+    assert response.closed
+
+
 # -----------------------------------------------------------------------------
 # INSEE estimates parser (POP3) and TOM eligibility
 # -----------------------------------------------------------------------------
 
 
-def _make_pop3_bytes() -> bytes:
-    """Build a minimal 2-year POP3 workbook matching the real layout."""
+def _make_pop3_bytes(*, header: bool = True) -> bytes:
+    """Build a minimal 2-year POP3 workbook matching the real layout.
+
+    With ``header=False`` the column-label row is left blank, so the parsed
+    cells hold only numbers and empty rows.
+    """
     import io
 
     import openpyxl
@@ -162,7 +310,10 @@ def _make_pop3_bytes() -> bytes:
         ws.append([])
         ws.append([])
         ws.append([None, None, "France métropolitaine", None, None, "France"])
-        ws.append(["Année de naissance", "Âge", "Ens", "H", "F", "Ens", "H", "F"])
+        if header:
+            ws.append(["Année de naissance", "Âge", "Ens", "H", "F", "Ens", "H", "F"])
+        else:
+            ws.append([])
         ws.append([])
         for r in rows:
             ws.append(list(r))
@@ -182,6 +333,24 @@ def test_parse_pop3_returns_long_table_france_entiere():
     assert df[(df.year == 2026) & (df.naissance == 2006)].population.sum() == 820
 
 
+def test_parse_pop3_without_header_row():
+    """Rows are kept when the sheet's numeric columns infer a numeric dtype."""
+    df = downloaders._parse_pop3(_make_pop3_bytes(header=False))
+
+    assert len(df) == 8
+    assert df.naissance.dtype == "int64"
+    assert df[(df.year == 2022) & (df.naissance == 2006)].population.sum() == 850
+
+
+def test_download_insee_estimates_parses_streamed_workbook(monkeypatch):
+    payload = _make_pop3_bytes()
+    _patch_get(monkeypatch, _FakeResponse([payload[:100], payload[100:]]))
+
+    df = downloaders.download_insee_estimates(cache_dir=None)
+
+    assert df[(df.year == 2022) & (df.naissance == 2006)].population.sum() == 850
+
+
 def test_synthesize_tom_defaults_to_eligible_only(monkeypatch):
     import pandas as pd
 
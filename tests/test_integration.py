@@ -599,14 +599,25 @@ def test_student_mobility_increases_20_24_concentration(
     The corrected geo_ratios for the 20_24 band should have higher per-(dept, sex)
     standard deviation than uncorrected, because the correction shifts population
     toward university-city EPCIs (increasing inequality = higher stddev).
+
+    The geo_ratios tables are dropped after projection, so each EPCI's ratio is
+    recovered as its share of the 20-24 (dept, sex) total in population_epci,
+    which is the department projection times that ratio.
     """
     import numpy as np
 
     def _mean_geo_ratio_stddev(conn):
         ratios = conn.execute("""
-            SELECT department_code, sex, epci_code, geo_ratio
-            FROM geo_ratios_epci
-            WHERE age_band = '20_24'
+            SELECT
+                department_code,
+                sex,
+                epci_code,
+                SUM(population)
+                    / SUM(SUM(population)) OVER (PARTITION BY department_code, sex)
+                    AS geo_ratio
+            FROM population_epci
+            WHERE year = 2022 AND age BETWEEN 20 AND 24
+            GROUP BY ALL
         """).df()
         stddevs = ratios.groupby(["department_code", "sex"])["geo_ratio"].std().dropna()
         return np.mean(stddevs.values)
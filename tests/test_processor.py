@@ -167,6 +167,33 @@ class TestProcessorInit:
         )
         assert processor.end_year == 2037
 
+    def test_context_manager_closes_connection(self):
+        """Leaving the with-block closes the DuckDB connection."""
+        import duckdb
+
+        with PopulationProcessor(cache_dir=None) as processor:
+            assert processor._fetchone("SELECT 1") == 1
+
+        with pytest.raises(duckdb.ConnectionException):
+            processor.conn.execute("SELECT 1")
+        processor.close()  # idempotent
+
+    def test_session_settings_applied(self):
+        """threads/memory_limit kwargs are forwarded to the DuckDB session."""
+        processor = PopulationProcessor(cache_dir=None, threads=2, memory_limit="1GB")
+        threads, insertion_order = processor.conn.execute(
+            "SELECT current_setting('threads'), "
+            "current_setting('preserve_insertion_order')"
+        ).fetchone()
+        assert threads == 2
+        assert insertion_order is False
+
+    def test_no_spill_disables_temp_directory(self, tmp_path):
+        """spill=False clears temp_directory even when a cache dir is set."""
+        processor = PopulationProcessor(cache_dir=tmp_path, spill=False)
+        temp_dir = processor._fetchone("SELECT current_setting('temp_directory')")
+        assert temp_dir == ""
+
 
 # -----------------------------------------------------------------------------
 # Test: Data Processing
@@ -185,11 +212,11 @@ class TestDataProcessing:
 
         processor._execute(
             sql.CREATE_BASE_TABLE.format(
-                parquet_path=sample_parquet,
                 where_clause="WHERE (2022 - CAST(ANAI AS INT)) BETWEEN 0 AND 120",
                 year=2022,
                 iris_sentinel_no_geo=IRIS_SENTINEL_NO_GEO,
-            )
+            ),
+            [str(sample_parquet)],
         )
         processor._base_table_created = True
 
@@ -218,6 +245,83 @@ class TestDataProcessing:
         assert "75101" in iris_codes  # From 75101XXXX
         assert "75101XXXX" not in iris_codes
 
+    def test_download_and_process_fetches_only_enabled_sources(
+        self, monkeypatch, sample_parquet
+    ):
+        """Census and enabled overseas sources are fetched, disabled ones skipped."""
+        from passculture.data.insee_population import duckdb_processor
+
+        calls = []
+
+        def fake_spm(year, cache_dir=None):
+            calls.append("spm")
+            return pd.DataFrame()
+
+        def fake_indcvi(year, cache_dir):
+            calls.append("indcvi")
+            return sample_parquet
+
+        def unexpected(*_a, **_k):
+            raise AssertionError("disabled source was fetched")
+
+        monkeypatch.setattr(duckdb_processor, "download_indcvi", fake_indcvi)
+        monkeypatch.setattr(duckdb_processor, "synthesize_spm_population", fake_spm)
+        monkeypatch.setattr(
+            duckdb_processor, "synthesize_mayotte_population", unexpected
+        )
+        monkeypatch.setattr(duckdb_processor, "synthesize_tom_population", unexpected)
+
+        processor = PopulationProcessor(
+            start_year=2022,
+            end_year=2022,
+            include_mayotte=False,
+            include_tom=False,
+            cache_dir=None,
+        )
+        processor.download_and_process()
+
+        assert sorted(calls) == ["indcvi", "spm"]
+        assert processor._row_count() > 0
+
+    def test_fetch_projection_inputs_only_needed_sources(self, monkeypatch):
+        """MOBSCO, estimates and loaded geo mappings are not fetched again."""
+        from passculture.data.insee_population import duckdb_processor
+
+        def unexpected(*_a, **_k):
+            raise AssertionError("unneeded source was fetched")
+
+        monkeypatch.setattr(
+            duckdb_processor,
+            "download_mnai_birth_distribution",
+            lambda year, cache_dir: pd.DataFrame({"month": [1]}),
+        )
+        monkeypatch.setattr(duckdb_processor, "download_mobsco", unexpected)
+        monkeypatch.setattr(duckdb_processor, "download_insee_estimates", unexpected)
+
+        processor = PopulationProcessor(
+            start_year=2022,
+            end_year=2022,
+            correct_student_mobility=False,
+            method="cohort-stable",
+            cache_dir=None,
+        )
+        processor._geo_mappings_loaded = True
+
+        assert list(processor._fetch_projection_inputs()) == ["monthly_births"]
+
+    def test_load_dataframe_unregisters_view(self, processor: PopulationProcessor):
+        """Loaded frames are copied into a table and no longer registered."""
+        import duckdb
+
+        df = pd.DataFrame({"department_code": ["75", "13"]})
+        processor._load_dataframe(
+            "depts_df", df, "CREATE TABLE depts AS SELECT * FROM depts_df"
+        )
+
+        assert processor._fetchone("SELECT COUNT(*) FROM depts") == 2
+        with pytest.raises(duckdb.CatalogException):
+            processor.conn.execute("SELECT * FROM depts_df")
+
     def test_requires_base_table(self, processor: PopulationProcessor):
         """Test that multi-level tables require base table to be created first."""
         with pytest.raises(RuntimeError, match="download_and_process"):
@@ -389,6 +493,63 @@ class TestMultiYearProjection:
         compute_geo_ratios(processor.conn, "canton")
         compute_geo_ratios(processor.conn, "iris")
 
+    def test_compute_all_geo_ratios_matches_per_level(self, projection_processor):
+        """One shared banded scan yields the same ratios as per-level calls."""
+        from passculture.data.insee_population.projections import (
+            compute_all_geo_ratios,
+        )
+
+        conn = projection_processor.conn
+        self._setup_projection_tables(projection_processor)
+        tables = ("geo_ratios_epci", "geo_ratios_canton", "geo_ratios_iris")
+        per_level = {
+            t: conn.execute(f"SELECT * FROM {t} ORDER BY ALL").fetchall()
+            for t in tables
+        }
+
+        compute_all_geo_ratios(conn)
+
+        for t in tables:
+            assert (
+                conn.execute(f"SELECT * FROM {t} ORDER BY ALL").fetchall()
+                == (per_level[t])
+            )
+        leftover = conn.execute(
+            "SELECT COUNT(*) FROM duckdb_tables() "
+            "WHERE table_name = 'population_banded'"
+        ).fetchone()[0]
+        assert leftover == 0
+
+    def test_projection_drops_scratch_tables(self, projection_processor):
+        """Inputs only needed while projecting are dropped afterwards."""
+        from passculture.data.insee_population import duckdb_processor
+
+        processor = projection_processor
+        processor.correct_student_mobility = False
+        processor.method = "cohort-stable"
+        processor._execute("CREATE TABLE mobility_weights AS SELECT 1 AS w")
+        processor._execute("CREATE TABLE insee_estimates AS SELECT 1 AS n")
+        monthly_df = pd.DataFrame(
+            [
+                {"department_code": d, "month": m, "month_ratio": 1.0 / 12}
+                for d in ["75", "13"]
+                for m in range(1, 13)
+            ]
+        )
+
+        processor._create_projected_tables({"monthly_births": monthly_df})
+
+        tables = {
+            name
+            for (name,) in processor.conn.execute(
+                "SELECT table_name FROM duckdb_tables()"
+            ).fetchall()
+        }
+        assert {"population_department", "population_iris"} <= tables
+        assert {"monthly_births", "population"} <= tables
+        assert not set(duckdb_processor._PROJECTION_SCRATCH_TABLES) & tables
+        assert not {t for t in tables if t.startswith("geo_ratios_")}
+
     def test_projected_department_has_required_columns(self, projection_processor):
         """Test projected department table has all required columns."""
         from passculture.data.insee_population.projections import project_multi_year
@@ -440,6 +601,36 @@ class TestMultiYearProjection:
         # Birth month should have all 12 values
         assert sorted(result["birth_month"].unique()) == list(range(1, 13))
 
+    def test_projected_department_confidence_by_year(self, projection_processor):
+        """confidence_pct widens with distance from census; bounds follow it."""
+        from passculture.data.insee_population.projections import project_multi_year
+
+        self._setup_projection_tables(projection_processor)
+        project_multi_year(
+            projection_processor.conn,
+            15,
+            20,
+            start_year=2022,
+            end_year=2027,
+        )
+
+        rows = projection_processor.conn.execute(
+            """
+            SELECT year,
+                   MIN(confidence_pct)::DOUBLE,
+                   MAX(confidence_pct)::DOUBLE,
+                   MAX(ABS(population_low - population * (1 - confidence_pct))),
+                   MAX(ABS(population_high - population * (1 + confidence_pct)))
+            FROM population_department GROUP BY year ORDER BY year
+            """
+        ).fetchall()
+        expected = {2022: 0.02, 2023: 0.02, 2024: 0.03, 2025: 0.03, 2026: 0.04}
+        expected[2027] = 0.05
+        for year, lo, hi, low_err, high_err in rows:
+            assert lo == hi == pytest.approx(expected[year])
+            assert low_err < 1e-9
+            assert high_err < 1e-9
+
     def test_projected_department_has_multiple_years(self, projection_processor):
         """Test projected data spans start_year to end_year."""
         from passculture.data.insee_population.projections import project_multi_year
@@ -794,6 +985,22 @@ class TestMultiYearProjection:
             f"Yearly Jan ({yearly_jan:.1f}) != Monthly Jan ({monthly_jan:.1f})"
         )
 
+    def test_age_band_expr_matches_age_buckets(
+        self, projection_processor: PopulationProcessor
+    ):
+        """Arithmetic age-band mapping agrees with AGE_BUCKETS for every age."""
+        from passculture.data.insee_population.constants import AGE_BUCKETS, MAX_AGE
+        from passculture.data.insee_population.projections import (
+            _build_age_band_expr,
+        )
+
+        rows = projection_processor.conn.execute(
+            f"SELECT age, {_build_age_band_expr()} "
+            f"FROM generate_series(0, {MAX_AGE}) AS t(age)"
+        ).fetchall()
+        expected = {age: band for band, ages in AGE_BUCKETS.items() for age in ages}
+        assert dict(rows) == expected
+
 
 # -----------------------------------------------------------------------------
 # Test: Simple Aging Projection
@@ -1379,23 +1586,24 @@ class TestStudentMobilityCorrection:
 
         from passculture.data.insee_population.projections import (
             compute_department_mobility_rates,
+            load_mobsco_students,
         )
 
-        compute_department_mobility_rates(processor.conn, mobsco_path)
+        load_mobsco_students(processor.conn, mobsco_path)
+        compute_department_mobility_rates(processor.conn)
 
-        return processor, mobsco_path
+        return processor
 
     def test_student_flows_computed(self, mobility_processor):
         """Test that student_flows_epci table is created with expected rows."""
-        processor, mobsco_path = mobility_processor
+        processor = mobility_processor
         from passculture.data.insee_population import sql
         from passculture.data.insee_population.projections import _build_band_config_sql
 
         processor.conn.execute(sql.RENAME_GEO_RATIOS_EPCI_TO_BASE)
         processor.conn.execute(
             sql.CREATE_STUDENT_FLOWS_EPCI.format(
-                mobsco_path=mobsco_path,
-                band_config_sql=_build_band_config_sql(),
+                band_config_sql=_build_band_config_sql()
             )
         )
 
@@ -1419,7 +1627,7 @@ class TestStudentMobilityCorrection:
 
     def test_correction_shifts_weight(self, mobility_processor):
         """Test that correction shifts geo_ratio for student bands."""
-        processor, mobsco_path = mobility_processor
+        processor = mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction,
         )
@@ -1431,7 +1639,7 @@ class TestStudentMobilityCorrection:
             ORDER BY epci_code, age_band, sex
         """).df()
 
-        apply_student_mobility_correction(processor.conn, mobsco_path)
+        apply_student_mobility_correction(processor.conn)
 
         corrected_ratios_75 = processor.conn.execute("""
             SELECT epci_code, age_band, sex, geo_ratio
@@ -1453,12 +1661,12 @@ class TestStudentMobilityCorrection:
 
     def test_ratios_still_sum_to_one(self, mobility_processor):
         """After correction, geo_ratios per (dept, band, sex) still sum to ~1.0."""
-        processor, mobsco_path = mobility_processor
+        processor = mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction,
         )
 
-        apply_student_mobility_correction(processor.conn, mobsco_path)
+        apply_student_mobility_correction(processor.conn)
 
         ratio_sums = processor.conn.execute("""
             SELECT department_code, age_band, sex, SUM(geo_ratio) AS ratio_sum
@@ -1473,7 +1681,7 @@ class TestStudentMobilityCorrection:
 
     def test_non_student_bands_unchanged(self, mobility_processor):
         """Bands other than 15_19/20_24 should be unchanged after correction."""
-        processor, mobsco_path = mobility_processor
+        processor = mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction,
         )
@@ -1485,7 +1693,7 @@ class TestStudentMobilityCorrection:
             ORDER BY department_code, epci_code, age_band, sex
         """).df()
 
-        apply_student_mobility_correction(processor.conn, mobsco_path)
+        apply_student_mobility_correction(processor.conn)
 
         corrected_other = processor.conn.execute("""
             SELECT department_code, epci_code, age_band, sex, geo_ratio
@@ -1597,23 +1805,24 @@ class TestIRISStudentMobilityCorrection:
         # Compute per-department mobility weights (needed before corrections)
         from passculture.data.insee_population.projections import (
             compute_department_mobility_rates,
+            load_mobsco_students,
         )
 
-        compute_department_mobility_rates(processor.conn, mobsco_path)
+        load_mobsco_students(processor.conn, mobsco_path)
+        compute_department_mobility_rates(processor.conn)
 
-        return processor, mobsco_path
+        return processor
 
     def test_iris_student_flows_computed(self, iris_mobility_processor):
         """Test that student_flows_iris table has expected IRIS codes."""
-        processor, mobsco_path = iris_mobility_processor
+        processor = iris_mobility_processor
         from passculture.data.insee_population import sql
         from passculture.data.insee_population.projections import _build_band_config_sql
 
         processor.conn.execute(sql.RENAME_GEO_RATIOS_IRIS_TO_BASE)
         processor.conn.execute(
             sql.CREATE_STUDENT_FLOWS_IRIS.format(
-                mobsco_path=mobsco_path,
-                band_config_sql=_build_band_config_sql(),
+                band_config_sql=_build_band_config_sql()
             )
         )
 
@@ -1665,7 +1874,7 @@ class TestIRISStudentMobilityCorrection:
         - 751010101: (1-0.225)*0.5 + 0 = 0.3875  (no intra-dept study destination)
         - 751020101: (1-0.225)*0.5 + 0.6*0.375 = 0.6125  (intra-dept study destination)
         """
-        processor, mobsco_path = iris_mobility_processor
+        processor = iris_mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction_iris,
         )
@@ -1678,7 +1887,7 @@ class TestIRISStudentMobilityCorrection:
             ORDER BY iris_code, age_band, sex
         """).df()
 
-        apply_student_mobility_correction_iris(processor.conn, mobsco_path)
+        apply_student_mobility_correction_iris(processor.conn)
 
         corrected_ratios = processor.conn.execute("""
             SELECT iris_code, age_band, sex, geo_ratio
@@ -1728,12 +1937,12 @@ class TestIRISStudentMobilityCorrection:
         - 751020101: (1-0.225)*0.5 + 0.6*0.375 = 0.6125  (approx)
         - Sum = 1.0 (preserved, no inflation)
         """
-        processor, mobsco_path = iris_mobility_processor
+        processor = iris_mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction_iris,
         )
 
-        apply_student_mobility_correction_iris(processor.conn, mobsco_path)
+        apply_student_mobility_correction_iris(processor.conn)
 
         corrected = processor.conn.execute("""
             SELECT iris_code, geo_ratio
@@ -1760,12 +1969,12 @@ class TestIRISStudentMobilityCorrection:
 
     def test_iris_ratios_still_sum_to_one(self, iris_mobility_processor):
         """After correction, geo_ratios_iris per (dept, band, sex) sum to ~1.0."""
-        processor, mobsco_path = iris_mobility_processor
+        processor = iris_mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction_iris,
         )
 
-        apply_student_mobility_correction_iris(processor.conn, mobsco_path)
+        apply_student_mobility_correction_iris(processor.conn)
 
         ratio_sums = processor.conn.execute("""
             SELECT department_code, age_band, sex, SUM(geo_ratio) AS ratio_sum
@@ -1782,7 +1991,7 @@ class TestIRISStudentMobilityCorrection:
 
     def test_iris_non_student_bands_unchanged(self, iris_mobility_processor):
         """Non-student bands should be unchanged after IRIS correction."""
-        processor, mobsco_path = iris_mobility_processor
+        processor = iris_mobility_processor
         from passculture.data.insee_population.projections import (
             apply_student_mobility_correction_iris,
         )
@@ -1794,7 +2003,7 @@ class TestIRISStudentMobilityCorrection:
             ORDER BY department_code, iris_code, age_band, sex
         """).df()
 
-        apply_student_mobility_correction_iris(processor.conn, mobsco_path)
+        apply_student_mobility_correction_iris(processor.conn)
 
         corrected_other = processor.conn.execute("""
             SELECT department_code, iris_code, age_band, sex, geo_ratio